@@ -0,0 +1,71 @@
+"""
+Entry point that serves the portfolio together with a few HTTP endpoints (Streamlit 1.66+)
+
+    streamlit run app.py
+
+`streamlit run Personal_website.py` still serves the site on its own, without the endpoints.
+"""
+import json
+from contextlib import asynccontextmanager
+
+import streamlit as st
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from memory_report import memory_report, prometheus_text
+from static_assets import ASSET_ROUTE, asset_response, enable_asset_route
+from timing import timing_summary
+from warmup import start_warm_up, warm_up_status
+
+
+async def memory(request):
+    """Memory held per session and by the caches; ?format=prometheus for the text exposition format"""
+    report = memory_report()
+    if request.query_params.get("format") == "prometheus":
+        return PlainTextResponse(prometheus_text(report), media_type="text/plain; version=0.0.4")
+    return Response(json.dumps(report, indent=2), media_type="application/json")
+
+
+async def timings(request):
+    """Percentiles of the time spent in each section of profiled reruns (see timing.py)"""
+    return Response(json.dumps(timing_summary(), indent=2), media_type="application/json")
+
+
+async def assets(request):
+    """Fingerprinted images, documents, stylesheet and sprite (see static_assets.py)"""
+    return asset_response(
+        request.path_params["path"],
+        request.headers.get("if-none-match"),
+        request.query_params.get("download"),
+        request.headers.get("accept-encoding"),
+    )
+
+
+async def ready(request):
+    """200 once the startup warm-up has filled the caches, 503 until then (or if it failed)"""
+    status = warm_up_status()
+    return Response(json.dumps(status, indent=2), status_code=200 if status["state"] == "ready" else 503, media_type="application/json")
+
+
+@asynccontextmanager
+async def lifespan(app):
+    # Warm up in the background: the server (and /_stcore/health) comes up at once, /api/ready follows
+    start_warm_up()
+    yield
+
+
+# Pages link to ASSET_ROUTE from now on
+enable_asset_route()
+
+# Streamlit reserves /_stcore/, /media/, /component/ and /static/, so the endpoints live under /api/
+# (the fingerprinted assets are the exception, see ASSET_ROUTE)
+app = st.App(
+    "Personal_website.py",
+    routes=[
+        Route("/api/memory", memory),
+        Route("/api/timings", timings),
+        Route("/api/ready", ready),
+        Route(ASSET_ROUTE + "{path:path}", assets),
+    ],
+    lifespan=lifespan,
+)
@@ -0,0 +1,83 @@
+"""
+Process-wide cache for the documents in Ect-files/
+Every session shares the same bytes, and an entry is refreshed when its file's mtime changes
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict, namedtuple
+
+# Upper bound for the bytes held by the cache (all sessions share it)
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+CachedDocument = namedtuple("CachedDocument", ["mtime_ns", "size", "digest", "data"])
+
+_lock = threading.Lock()
+_documents = OrderedDict()  # path -> CachedDocument, least recently used first
+_blobs = {}  # digest -> bytes, so identical files are only held once
+
+
+def _cached_bytes():
+    """Total bytes held, counting each distinct content once."""
+    return sum(len(data) for data in _blobs.values())
+
+
+def _evict(path):
+    """Drop a path and release its bytes if no other path shares them."""
+    entry = _documents.pop(path)
+    if not any(other.digest == entry.digest for other in _documents.values()):
+        _blobs.pop(entry.digest, None)
+
+
+def _load(path):
+    """Return the cache entry for a path, reading the file if it changed on disk."""
+    stat = os.stat(path)
+    with _lock:
+        entry = _documents.get(path)
+        if entry and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size:
+            _documents.move_to_end(path)
+            return entry
+
+    # Read outside the lock so a slow disk doesn't block other sessions
+    with open(path, "rb") as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    with _lock:
+        if path in _documents:
+            _evict(path)
+        data = _blobs.setdefault(digest, data)
+        entry = CachedDocument(stat.st_mtime_ns, len(data), digest, data)
+        _documents[path] = entry
+        # Keep the newest entry even if it is larger than the budget on its own
+        while _cached_bytes() > MAX_CACHE_BYTES and len(_documents) > 1:
+            _evict(next(iter(_documents)))
+    return entry
+
+
+def read_document(path: str) -> bytes:
+    """Return the bytes of a document, raising FileNotFoundError like open() does."""
+    return _load(path).data
+
+
+def document_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a document's current contents."""
+    return _load(path).digest
+
+
+def clear_document_cache():
+    """Forget every cached document."""
+    with _lock:
+        _documents.clear()
+        _blobs.clear()
+
+
+def document_cache_stats() -> dict:
+    """Summary of what the cache currently holds."""
+    with _lock:
+        return {
+            "documents": len(_documents),
+            "unique_blobs": len(_blobs),
+            "bytes": _cached_bytes(),
+            "max_bytes": MAX_CACHE_BYTES,
+        }
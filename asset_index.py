@@ -0,0 +1,100 @@
+"""
+Index of the project images, built once when the app starts
+A single directory scan replaces probing every candidate path for each image on each rerun
+"""
+import logging
+import os
+import threading
+from functools import lru_cache
+
+from static_assets import clear_asset_urls
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Same places get_image_path used to probe, in the same priority order
+SEARCH_DIRS = [
+    "Projects",  # Local development path (uppercase)
+    "projects",  # Deployment path (lowercase)
+    "./Projects",  # Relative path (uppercase)
+    "./projects",  # Relative path (lowercase)
+    f"{APP_DIR}/Projects",  # Absolute path (uppercase)
+    f"{APP_DIR}/projects",  # Absolute path (lowercase)
+    "../Projects",  # One level up (uppercase)
+    "../projects",  # One level up (lowercase)
+]
+
+_lock = threading.Lock()
+_index = None
+
+logger = logging.getLogger(__name__)
+
+
+def build_asset_index() -> dict:
+    """Scan SEARCH_DIRS and map each lowercased filename to the first path it was found at."""
+    global _index
+    index = {}
+    for directory in SEARCH_DIRS:
+        try:
+            filenames = os.listdir(directory)
+        except OSError:
+            continue
+        for filename in filenames:
+            index.setdefault(filename.lower(), f"{directory}/{filename}")
+    with _lock:
+        _index = index
+    clear_asset_urls()
+    return index
+
+
+def invalidate_asset_index():
+    """Forget the index; the next lookup rescans the directories."""
+    global _index
+    with _lock:
+        _index = None
+    clear_asset_urls()
+
+
+def find_asset(filename):
+    """Return the path of an image (case-insensitively), or None if it isn't on disk."""
+    index = _index
+    if index is None:
+        index = build_asset_index()
+    # A miss is just as cheap as a hit; asset_report lists the referenced images that are missing
+    return index.get(filename.lower())
+
+
+def asset_report(filenames):
+    """Check every referenced image against the index and log what is missing."""
+    found, missing = {}, []
+    for filename in filenames:
+        path = find_asset(filename)
+        if path:
+            found[filename] = path
+        else:
+            missing.append(filename)
+    report = {
+        "cwd": os.getcwd(),
+        "searched": [directory for directory in SEARCH_DIRS if os.path.isdir(directory)],
+        "found": found,
+        "missing": missing,
+    }
+    logger.info("Asset check: %d of %d referenced images found", len(found), len(filenames))
+    if missing:
+        logger.warning(
+            "Missing images (a placeholder is shown instead): %s. Searched %s from %s",
+            ", ".join(missing), report["searched"], report["cwd"],
+        )
+    return report
+
+
+@lru_cache(maxsize=None)
+def placeholder_svg(width=800, height=450):
+    """Lightweight stand-in for a missing photo; st.image sends an SVG string as a data URI."""
+    return f"""<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">
+<rect width="100%" height="100%" rx="12" fill="#182C61"/>
+<text x="50%" y="50%" fill="#eaf0ff" font-family="sans-serif" font-size="28" text-anchor="middle" dominant-baseline="middle">Photo coming soon</text>
+</svg>"""
+
+
+# Scan once at startup so the first page view doesn't pay for it
+build_asset_index()
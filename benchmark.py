@@ -0,0 +1,157 @@
+"""
+Benchmark of what a rerun of Personal_website.py costs, for every tab and every project page
+Runs the app headless with Streamlit's AppTest and records, per page: wall time of a rerun,
+elements emitted, bytes of media registered and peak Python memory during the run.
+
+    python benchmark.py --save      # record benchmark_baseline.json
+    python benchmark.py             # compare against it; exits with 1 on a regression
+"""
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATH = os.path.join(APP_DIR, "Personal_website.py")
+BASELINE_PATH = os.path.join(APP_DIR, "benchmark_baseline.json")
+
+TABS = ["Home", "Projects", "Skills", "Google Cybersecurity Cert"]
+
+# How much worse than the baseline a metric may get before it counts as a regression
+TOLERANCES = {
+    "wall_ms": 0.5,  # timings are noisy, and the baseline may come from another machine
+    "elements": 0.0,
+    "media_bytes": 0.1,
+    "peak_kb": 0.25,
+}
+
+
+def scenarios():
+    """(name, tab, project slug) of every page: the four tabs, then each project's detail page"""
+    from project_registry import PROJECTS
+
+    pages = [(f"tab:{tab}", tab, None) for tab in TABS]
+    pages += [(f"project:{project['slug']}", "Projects", project["slug"]) for project in PROJECTS]
+    return pages
+
+
+def _count_elements(node):
+    """Number of elements (not layout blocks) below a node of the AppTest tree"""
+    children = getattr(node, "children", None)
+    if children is None:
+        return 1
+    return sum(_count_elements(child) for child in children.values())
+
+
+def _run_recording_media(app):
+    """Rerun an AppTest and return the bytes of media (images, downloads) the run registered"""
+    from unittest import mock
+
+    from streamlit.testing.v1 import app_test
+
+    # AppTest gives every run a fresh in-memory media store; keep hold of this run's one
+    storages = []
+
+    class RecordingStorage(app_test.MemoryMediaFileStorage):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            storages.append(self)
+
+    with mock.patch.object(app_test, "MemoryMediaFileStorage", RecordingStorage):
+        app.run()
+    return sum(stat.byte_length for storage in storages for stats in storage.get_stats().values() for stat in stats)
+
+
+def measure(tab, slug, repeat=5):
+    """Load a page, then time `repeat` reruns of it and measure one more under tracemalloc"""
+    from streamlit.testing.v1 import AppTest
+
+    app = AppTest.from_file(SCRIPT_PATH, default_timeout=60)
+    app.session_state["section"] = tab
+    if slug:
+        app.query_params["project"] = slug
+    app.run()  # first load: imports, startup caches
+    if app.exception:
+        raise RuntimeError(f"{tab} / {slug}: {app.exception[0].message}")
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.run()
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    media_bytes = _run_recording_media(app)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return {
+        "wall_ms": round(statistics.median(timings), 2),
+        "elements": _count_elements(app.main) + _count_elements(app.sidebar),
+        "media_bytes": media_bytes,
+        "peak_kb": round(peak / 1024, 1),
+    }
+
+
+def run(repeat=5):
+    """Measure every page; returns {scenario: metrics}"""
+    # The app opens its files relative to the working directory, like `streamlit run` does
+    os.chdir(APP_DIR)
+    sys.path.insert(0, APP_DIR)
+    return {name: measure(tab, slug, repeat) for name, tab, slug in scenarios()}
+
+
+def compare(results, baseline):
+    """Return the (scenario, metric, baseline, current) that got worse than TOLERANCES allow"""
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric, tolerance in TOLERANCES.items():
+            if metrics[metric] > previous[metric] * (1 + tolerance):
+                regressions.append((name, metric, previous[metric], metrics[metric]))
+    return regressions
+
+
+def _report(results, baseline):
+    print(f"{'page':<36}{'wall ms':>10}{'elements':>10}{'media KB':>10}{'peak KB':>10}")
+    for name, metrics in results.items():
+        previous = baseline.get(name, {})
+        delta = f"  ({metrics['wall_ms'] - previous['wall_ms']:+.1f} ms)" if previous else ""
+        print(
+            f"{name:<36}{metrics['wall_ms']:>10.1f}{metrics['elements']:>10}"
+            f"{metrics['media_bytes'] / 1024:>10.1f}{metrics['peak_kb']:>10.1f}{delta}"
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark a rerun of every tab and project page")
+    parser.add_argument("--repeat", type=int, default=5, help="timed reruns per page (default: 5)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file (default: benchmark_baseline.json)")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    results = run(args.repeat)
+    _report(results, baseline)
+
+    if args.save:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2, sort_keys=True)
+        print(f"Saved baseline to {args.baseline}")
+    elif baseline:
+        regressions = compare(results, baseline)
+        for name, metric, previous, current in regressions:
+            print(f"REGRESSION {name}: {metric} {previous} -> {current}")
+        sys.exit(1 if regressions else 0)
+    else:
+        print(f"No baseline at {args.baseline}; run with --save to record one")
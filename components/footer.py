@@ -1,57 +1,60 @@
 import streamlit as st
 
-def render_footer():
-    st.markdown("---")
-    
-    # Current year for copyright
-    import datetime
-    current_year = datetime.datetime.now().year
-    
-    # Footer with animated icons
-    st.markdown(f"""
-    <style>
-    .footer {{
-        text-align: center;
-        padding: 30px 0;
-        color: var(--light-text, #6c757d);
-        margin-top: 40px;
-    }}
-    
-    .social-icons {{
-        display: flex;
-        justify-content: center;
-        gap: 25px;
-        margin: 20px 0;
-    }}
-    
-    .social-icon {{
-        font-size: 24px;
-        color: var(--secondary, #0096c7);
-        transition: transform 0.3s ease, color 0.3s ease;
-    }}
-    
-    .social-icon:hover {{
-        transform: translateY(-5px);
-        color: var(--primary, #2E3B4E);
-    }}
-    </style>
-    
+from components.icons import icon_svg
+
+# Footer styles (part of the stylesheet bundle, see components/styles.py)
+FOOTER_CSS = """
+.footer {
+    text-align: center;
+    padding: 30px 0;
+    color: var(--light-text, #6c757d);
+    margin-top: 40px;
+}
+
+.social-icons {
+    display: flex;
+    justify-content: center;
+    gap: 25px;
+    margin: 20px 0;
+}
+
+.social-icon {
+    display: inline-flex;
+    color: var(--secondary, #0096c7);
+    transition: transform 0.3s ease, color 0.3s ease;
+}
+
+.social-icon:hover {
+    transform: translateY(-5px);
+    color: var(--primary, #2E3B4E);
+}
+"""
+
+def footer_html(current_year, sprite_url=None):
+    """Footer with animated icons"""
+    return f"""
     <div class="footer">
         <div class="social-icons">
             <a href="https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit" target="_blank" class="social-icon">
-                <i class="fab fa-github"></i>
+                {icon_svg('github', size=24, sprite_url=sprite_url)}
             </a>
             <a href="https://www.linkedin.com/in/mischa-nelson-4a60842a7" target="_blank" class="social-icon">
-                <i class="fab fa-linkedin"></i>
+                {icon_svg('linkedin', size=24, sprite_url=sprite_url)}
             </a>
             <a href="mailto:contact@mischanelson.dev" class="social-icon">
-                <i class="fas fa-envelope"></i>
+                {icon_svg('envelope', size=24, sprite_url=sprite_url)}
             </a>
         </div>
         <p>© {current_year} Mischa Nelson. All rights reserved.</p>
         <p style="font-size: 0.9rem;">Built with Python and Streamlit</p>
     </div>
+    """
+
+def render_footer():
+    st.markdown("---")
+    
+    # Current year for copyright
+    import datetime
+    current_year = datetime.datetime.now().year
     
-    <!-- Import Font Awesome for social icons -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0-beta3/css/all.min.css">
-    """, unsafe_allow_html=True)
+    st.markdown(footer_html(current_year), unsafe_allow_html=True)
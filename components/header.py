@@ -1,90 +1,129 @@
 import streamlit as st
 
+from components.icons import icon_svg
+from image_variants import PROFILE_IMAGE as PROFILE_VARIANTS, image_lqip, variant_url
+from static_assets import asset_url
+
+NAME = "Mischa Nelson"
+
+PROFILE_IMAGE = "Ect-files/pfp.png"
+
+# Profile image with rounded corners - with dark mode support and hover animation
+# (part of the stylesheet bundle, see components/styles.py)
+PROFILE_CSS = """
+.profile-img {
+    border-radius: 50%;
+    border: 3px solid var(--secondary, #0096c7);
+    width: 150px;
+    height: 150px;
+    object-fit: cover;
+    box-shadow: 0 4px 10px rgba(0,0,0,0.15);
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+
+.profile-img:hover {
+    transform: scale(1.05);
+    box-shadow: 0 8px 20px rgba(0,0,0,0.2);
+}
+"""
+
+# Text gradient with dark mode compatibility
+INTRO_HTML = """
+<div style="margin-bottom: 20px;">
+    <span style="color: var(--secondary, #0096c7);
+                font-size: 1.2rem;
+                font-weight: 600;">
+        Cybersecurity Enthusiast | Student Developer | Electronics Hobbyist
+    </span>
+</div>
+
+<div style="margin-bottom: 20px;">
+    <p style="font-size: 1rem; line-height: 1.5; color: var(--text);">
+        I solve complex problems with code and hardware, specializing in cybersecurity solutions and innovative electronics projects.
+    </p>
+</div>
+"""
+
+# Social links with icons: label, icon in static/icons.svg, address and icon colour
+SOCIAL_LINKS = [
+    {
+        "label": "LinkedIn",
+        "icon": "linkedin",
+        "url": "https://www.linkedin.com/in/mischa-nelson-4a60842a7",
+        "fill": "#0A66C2",
+    },
+    {
+        "label": "GitHub",
+        "icon": "github",
+        "url": "https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit",
+        "fill": "currentColor",
+    },
+    {
+        "label": "Email",
+        "icon": "envelope",
+        "url": "mailto:contact@mischanelson.dev",
+        "fill": "currentColor",
+    },
+]
+
+
+def social_link_html(link, sprite_url=None):
+    """Icon and label of one social link"""
+    # mailto: links stay in the same tab
+    target = "" if link["url"].startswith("mailto:") else ' target="_blank"'
+    return f"""
+<a href="{link['url']}"{target} style="text-decoration: none;">
+    <div style="display: flex; align-items: center; color: #444;">
+        {icon_svg(link['icon'], fill=link['fill'], sprite_url=sprite_url)}
+        <span style="margin-left: 5px;">{link['label']}</span>
+    </div>
+</a>
+"""
+
+
+def profile_picture_html():
+    """
+    The profile photo at 150 px (300 px on 2x screens), painted over a tiny inlined blur of itself
+    so the first paint doesn't wait for the photo. None until `python image_variants.py` has run.
+    """
+    lqip = image_lqip(PROFILE_VARIANTS)
+    if not lqip:
+        return None
+    def srcset(fmt):
+        return f"{variant_url(PROFILE_VARIANTS, 150, formats=(fmt,))} 1x, {variant_url(PROFILE_VARIANTS, 300, formats=(fmt,))} 2x"
+    sources = "".join(
+        f'<source type="image/{fmt}" srcset="{srcset(fmt)}">'
+        for fmt in ("avif", "webp") if variant_url(PROFILE_VARIANTS, 150, formats=(fmt,))
+    )
+    return (
+        f'<picture>{sources}<img src="{variant_url(PROFILE_VARIANTS, 150, formats=("jpg",))}" srcset="{srcset("jpg")}"'
+        f' class="profile-img" width="150" height="150" alt="{NAME}" fetchpriority="high" decoding="async"'
+        f' style="background: url({lqip}) center / cover;"></picture>'
+    )
+
+
 def render_header():
     # Create a two-column layout for the header
     header_col1, header_col2 = st.columns([1, 3])
     
     with header_col1:
-        # Profile image with rounded corners - with dark mode support and hover animation
-        st.markdown("""
-        <style>
-        .profile-img {
-            border-radius: 50%;
-            border: 3px solid var(--secondary, #0096c7);
-            width: 150px;
-            height: 150px;
-            object-fit: cover;
-            box-shadow: 0 4px 10px rgba(0,0,0,0.15);
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-        }
-        
-        .profile-img:hover {
-            transform: scale(1.05);
-            box-shadow: 0 8px 20px rgba(0,0,0,0.2);
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        # Use profile picture from Ect-files instead of placeholder
-        try:
-            st.image("Ect-files/pfp.png", width=150, output_format="PNG", clamp=True)
-        except:
-            # Fallback to placeholder if image not found
-            st.markdown('<img src="https://via.placeholder.com/150" class="profile-img">', unsafe_allow_html=True)
+        # Resized copies of the profile picture when they have been built, the original otherwise
+        picture = profile_picture_html()
+        if picture:
+            st.markdown(picture, unsafe_allow_html=True)
+        else:
+            # Use profile picture from Ect-files instead of placeholder
+            try:
+                st.image(asset_url(PROFILE_IMAGE, PROFILE_IMAGE), width=150, output_format="PNG", clamp=True)
+            except:
+                # Fallback to placeholder if image not found
+                st.markdown('<img src="https://via.placeholder.com/150" class="profile-img">', unsafe_allow_html=True)
     
     with header_col2:
-        st.title("Mischa Nelson")
-        # Text gradient with dark mode compatibility
-        st.markdown("""
-        <div style="margin-bottom: 20px;">
-            <span style="color: var(--secondary, #0096c7);
-                        font-size: 1.2rem;
-                        font-weight: 600;">
-                Cybersecurity Enthusiast | Student Developer | Electronics Hobbyist
-            </span>
-        </div>
-        
-        <div style="margin-bottom: 20px;">
-            <p style="font-size: 1rem; line-height: 1.5; color: var(--text);">
-                I solve complex problems with code and hardware, specializing in cybersecurity solutions and innovative electronics projects.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.title(NAME)
+        st.markdown(INTRO_HTML, unsafe_allow_html=True)
         
         # Social links with icons
-        cols = st.columns(3)
-        with cols[0]:
-            st.markdown("""
-            <a href="https://www.linkedin.com/in/mischa-nelson-4a60842a7" target="_blank" style="text-decoration: none;">
-                <div style="display: flex; align-items: center; color: #444;">
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="#0A66C2" viewBox="0 0 16 16">
-                        <path d="M0 1.146C0 .513.526 0 1.175 0h13.65C15.474 0 16 .513 16 1.146v13.708c0 .633-.526 1.146-1.175 1.146H1.175C.526 16 0 15.487 0 14.854V1.146zm4.943 12.248V6.169H2.542v7.225h2.401zm-1.2-8.212c.837 0 1.358-.554 1.358-1.248-.015-.709-.52-1.248-1.342-1.248-.822 0-1.359.54-1.359 1.248 0 .694.521 1.248 1.327 1.248h.016zm4.908 8.212V9.359c0-.216.016-.432.08-.586.173-.431.568-.878 1.232-.878.869 0 1.216.662 1.216 1.634v3.865h2.401V9.25c0-2.22-1.184-3.252-2.764-3.252-1.274 0-1.845.7-2.165 1.193v.025h-.016a5.54 5.54 0 0 1 .016-.025V6.169h-2.4c.03.678 0 7.225 0 7.225h2.4z"/>
-                    </svg>
-                    <span style="margin-left: 5px;">LinkedIn</span>
-                </div>
-            </a>
-            """, unsafe_allow_html=True)
-        
-        with cols[1]:
-            st.markdown("""
-            <a href="https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit" target="_blank" style="text-decoration: none;">
-                <div style="display: flex; align-items: center; color: #444;">
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" viewBox="0 0 16 16">
-                        <path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.012 8.012 0 0 0 16 8c0-4.42-3.58-8-8-8z"/>
-                    </svg>
-                    <span style="margin-left: 5px;">GitHub</span>
-                </div>
-            </a>
-            """, unsafe_allow_html=True)
-            
-        with cols[2]:
-            st.markdown("""
-            <a href="mailto:contact@mischanelson.dev" style="text-decoration: none;">
-                <div style="display: flex; align-items: center; color: #444;">
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" fill="currentColor" viewBox="0 0 16 16">
-                        <path d="M0 4a2 2 0 0 1 2-2h12a2 2 0 0 1 2 2v8a2 2 0 0 1-2 2H2a2 2 0 0 1-2-2V4zm2-1a1 1 0 0 0-1 1v.217l7 4.2 7-4.2V4a1 1 0 0 0-1-1H2zm13 2.383-4.708 2.825L15 11.105V5.383zm-.034 6.876-5.64-3.471L8 9.583l-1.326-.795-5.64 3.47A1 1 0 0 0 2 13h12a1 1 0 0 0 .966-.741zM1 11.105l4.708-2.897L1 5.383v5.722z"/>
-                    </svg>
-                    <span style="margin-left: 5px;">Email</span>
-                </div>
-            </a>
-            """, unsafe_allow_html=True)
+        for column, link in zip(st.columns(len(SOCIAL_LINKS)), SOCIAL_LINKS):
+            with column:
+                st.markdown(social_link_html(link), unsafe_allow_html=True)
@@ -0,0 +1,21 @@
+"""
+Icons from the local SVG sprite in static/icons.svg
+The browser fetches the sprite once and caches it, so no icon font or CDN is needed.
+"""
+import os
+
+from static_assets import asset_url
+
+ICONS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "icons.svg")
+
+# Where Streamlit's static file serving (server.enableStaticServing) exposes static/icons.svg
+ICONS_URL = "/app/static/icons.svg"
+
+
+def icon_svg(name, size=16, fill="currentColor", sprite_url=None):
+    """Inline <svg> drawing the sprite's symbol `name` (github, linkedin or envelope)"""
+    sprite_url = sprite_url or asset_url(ICONS_PATH, ICONS_URL)
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" fill="{fill}" aria-hidden="true">'
+        f'<use href="{sprite_url}#{name}"/></svg>'
+    )
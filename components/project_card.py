@@ -1,4 +1,5 @@
 import streamlit as st
+from project_registry import STATUS_INDICATORS
 
 def project_card(title, description, status, key, on_click):
     """
@@ -12,14 +13,8 @@ def project_card(title, description, status, key, on_click):
     - on_click: Function to call when clicked
     """
     
-    # Status indicators and colors
-    status_indicators = {
-        "completed": {"emoji": "✅", "label": "Completed", "color": "#28a745"},
-        "in_progress": {"emoji": "🚧", "label": "In Progress", "color": "#fd7e14"},
-        "planned": {"emoji": "🔍", "label": "Planned", "color": "#6f42c1"}
-    }
-    
-    indicator = status_indicators.get(status, status_indicators["planned"])
+    # Status indicators and colors are shared with the project listing
+    indicator = STATUS_INDICATORS.get(status, STATUS_INDICATORS["planned"])
     
     st.markdown(f"""
     <div class="custom-card">
@@ -0,0 +1,172 @@
+import base64
+import hashlib
+import html
+import json
+import re
+import threading
+import time
+
+from asset_index import find_asset, placeholder_svg
+from github_images import REVALIDATE_AFTER, github_image_src
+from project_registry import iter_blocks
+from image_variants import image_size, variant_srcsets, variant_url, FULL_COLUMN_WIDTH, HALF_COLUMN_WIDTH
+from static_assets import asset_generation
+
+# Rendered pages shared by every session: slug -> (fingerprint, html)
+_pages = {}
+_pages_lock = threading.Lock()
+
+# slug -> (asset generation, time computed, fingerprint or None if the page can't be pre-rendered)
+_fingerprints = {}
+
+# How wide a photo is drawn, for the browser to pick a candidate from srcset
+_SIZES = {
+    "half": "(max-width: 640px) 100vw, 50vw",
+    "full": "100vw",
+}
+
+_INLINE_LINK = re.compile(r"\[([^\]]+)\]\((https?://[^)\s]+)\)|(https?://[^\s<)]+)")
+_INLINE_BOLD = re.compile(r"\*\*(.+?)\*\*")
+
+
+def inline_html(text):
+    """Convert the bit of markdown used in the registry (links, bare URLs, bold) to escaped HTML"""
+    def link(match):
+        label, url, bare = match.groups()
+        url = url or bare
+        return f'<a href="{url}" target="_blank">{label or url}</a>'
+
+    return _INLINE_BOLD.sub(r"<strong>\1</strong>", _INLINE_LINK.sub(link, html.escape(text)))
+
+
+def _image_source(filename):
+    """How an image can be shown: "variants", "missing", or "disk" (original only, not servable by URL)"""
+    if variant_srcsets(filename):
+        return "variants"
+    return "disk" if find_asset(filename) else "missing"
+
+
+def _figure(img, caption):
+    caption_html = f"<figcaption>{html.escape(caption)}</figcaption>" if caption else ""
+    return f'<figure class="project-figure">{img}{caption_html}</figure>'
+
+
+def _image_html(block):
+    filename, caption = block["image"], block.get("caption")
+    alt = html.escape(caption or filename)
+    srcsets = variant_srcsets(filename)
+    if srcsets:
+        width = block.get("width", "full")
+        fallback = variant_url(filename, HALF_COLUMN_WIDTH if width == "half" else FULL_COLUMN_WIDTH, formats=("jpg", "webp"))
+        size = image_size(filename)
+        dimensions = f' width="{size[0]}" height="{size[1]}"' if size else ""
+        # Modern formats first; the browser takes the first <source> it can decode
+        sources = "".join(
+            f'<source type="image/{fmt}" srcset="{html.escape(srcsets[fmt])}" sizes="{_SIZES[width]}">'
+            for fmt in ("avif", "webp") if fmt in srcsets
+        )
+        img = (
+            f'<img src="{html.escape(fallback)}" srcset="{html.escape(srcsets.get("jpg", ""))}" sizes="{_SIZES[width]}"'
+            f' alt="{alt}"{dimensions} loading="lazy" decoding="async">'
+        )
+        return _figure(f"<picture>{sources}{img}</picture>", caption)
+    if block.get("github_fallback"):
+        return _figure(f'<img src="{html.escape(github_image_src(filename))}" alt="{alt}" loading="lazy">', caption)
+    placeholder = base64.b64encode(placeholder_svg().encode("utf-8")).decode("ascii")
+    return _figure(f'<img src="data:image/svg+xml;base64,{placeholder}" alt="{alt}">', caption)
+
+
+def _list_html(items, tag):
+    # Extra lines of an item continue it, as they do in the markdown lists
+    rows = ("<br>".join(inline_html(line) for line in item.split("\n")) for item in items)
+    return f"<{tag}>{''.join(f'<li>{row}</li>' for row in rows)}</{tag}>"
+
+
+def _blocks_html(blocks):
+    parts = []
+    for block in blocks:
+        if "h3" in block:
+            parts.append(f"<h3>{inline_html(block['h3'])}</h3>")
+        elif "h4" in block:
+            parts.append(f"<h4>{inline_html(block['h4'])}</h4>")
+        elif "subheader" in block:
+            parts.append(f"<h3>{inline_html(block['subheader'])}</h3>")
+        elif "text" in block or "markdown" in block:
+            parts.append(f"<p>{inline_html(block.get('text', block.get('markdown')))}</p>")
+        elif "list" in block:
+            parts.append(_list_html(block["list"], "ul"))
+        elif "steps" in block:
+            parts.append(_list_html(block["steps"], "ol"))
+        elif "image" in block:
+            parts.append(_image_html(block))
+        elif "columns" in block:
+            columns = "".join(f"<div>{_blocks_html(column)}</div>" for column in block["columns"])
+            parts.append(f'<div class="project-columns">{columns}</div>')
+        elif "divider" in block:
+            parts.append("<hr>")
+    return "".join(parts)
+
+
+def _images(project):
+    return [block for block in iter_blocks(project["content"]) if "image" in block]
+
+
+def page_fingerprint(project):
+    """Hash of a project's registry entry plus how each of its images currently resolves"""
+    digest = hashlib.sha256(json.dumps(project, sort_keys=True).encode("utf-8"))
+    for block in _images(project):
+        digest.update(block["image"].encode("utf-8"))
+        digest.update(json.dumps(variant_srcsets(block["image"]), sort_keys=True).encode("utf-8"))
+        source = _image_source(block["image"])
+        digest.update(source.encode("utf-8"))
+        # Downloaded copies replace the GitHub URL once they're on disk
+        if source == "missing" and block.get("github_fallback"):
+            digest.update(github_image_src(block["image"]).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _current_fingerprint(project):
+    """
+    page_fingerprint of a project, or None if a photo is only available as an unprocessed original
+
+    Worked out again only when the manifests, the image index or a downloaded photo change (they all
+    bump the asset generation), or once a day so that GitHub photos get revalidated.
+    """
+    generation = asset_generation()
+    cached = _fingerprints.get(project["slug"])
+    if cached and cached[0] == generation and time.monotonic() - cached[1] < REVALIDATE_AFTER:
+        return cached[2]
+    renderable = not any(_image_source(block["image"]) == "disk" for block in _images(project))
+    fingerprint = page_fingerprint(project) if renderable else None
+    with _pages_lock:
+        _fingerprints[project["slug"]] = (generation, time.monotonic(), fingerprint)
+    return fingerprint
+
+
+def page_cache_stats():
+    """Number and total size of the rendered pages held in memory"""
+    with _pages_lock:
+        pages = [page for _, page in _pages.values()]
+    return {"pages": len(pages), "bytes": sum(len(page.encode("utf-8")) for page in pages)}
+
+
+def project_page_html(project):
+    """
+    Render a project's detail page into a single HTML fragment, cached across sessions
+
+    Returns None when a photo is only available as an unprocessed original (run
+    `python image_variants.py`); those pages fall back to element-by-element rendering.
+    """
+    fingerprint = _current_fingerprint(project)
+    if fingerprint is None:
+        return None
+    with _pages_lock:
+        cached = _pages.get(project["slug"])
+    if cached and cached[0] == fingerprint:
+        return cached[1]
+
+    # No blank lines or indentation, so markdown passes the whole fragment through as HTML
+    page = f'<div class="project-page"><h2>{inline_html(project["name"])}</h2>{_blocks_html(project["content"])}</div>'
+    with _pages_lock:
+        _pages[project["slug"]] = (fingerprint, page)
+    return page
@@ -0,0 +1,186 @@
+"""
+Every stylesheet of the site, bundled into one minified file named after its content hash
+Pages link to the file instead of re-sending kilobytes of <style> markdown on every rerun.
+"""
+import hashlib
+import os
+import re
+from functools import lru_cache
+
+from components.footer import FOOTER_CSS
+from components.header import PROFILE_CSS
+from components.skills import SKILLS_CSS
+from static_assets import asset_url
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CSS_DIR = os.path.join(APP_DIR, "static", "css")
+
+# Where Streamlit's static file serving (server.enableStaticServing) exposes CSS_DIR
+CSS_URL = "/app/static/css/"
+
+# Global CSS with animations and smooth transitions - but let Streamlit handle the theming
+GLOBAL_CSS = """
+/* Animation for section entries */
+@keyframes fadeInUp {
+    from {
+        opacity: 0;
+        transform: translateY(20px);
+    }
+    to {
+        opacity: 1;
+        transform: translateY(0);
+    }
+}
+
+/* Apply animations to sections */
+.stMarkdown, .stHeader, div[data-testid="stVerticalBlock"] > div {
+    animation: fadeInUp 0.5s ease forwards;
+}
+
+/* Stagger animations */
+div[data-testid="stVerticalBlock"] > div:nth-child(2) {
+    animation-delay: 0.1s;
+}
+div[data-testid="stVerticalBlock"] > div:nth-child(3) {
+    animation-delay: 0.2s;
+}
+
+/* Project cards */
+.custom-card {
+    border-radius: 10px;
+    padding: 20px;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    margin-bottom: 20px;
+    border-left: 4px solid #3867d6;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+
+.custom-card:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 10px 20px rgba(0,0,0,0.12);
+}
+
+/* Featured project styling */
+.featured-project {
+    border: none !important;
+    border-radius: 12px !important;
+    padding: 25px !important;
+    background: linear-gradient(to right, rgba(56, 103, 214, 0.1), rgba(72, 219, 251, 0.05)) !important;
+    margin-bottom: 30px !important;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.08) !important;
+    transition: transform 0.3s ease, box-shadow 0.3s ease;
+}
+
+.featured-project:hover {
+    transform: translateY(-5px);
+    box-shadow: 0 15px 35px rgba(0,0,0,0.15) !important;
+}
+
+.featured-badge {
+    background: linear-gradient(45deg, #5c7aea, #3867d6) !important;
+    color: white !important;
+    padding: 6px 14px !important;
+    border-radius: 20px !important;
+    font-weight: 600 !important;
+    font-size: 0.8em !important;
+    margin-bottom: 15px !important;
+    display: inline-block !important;
+    box-shadow: 0 2px 10px rgba(0, 134, 227, 0.2) !important;
+}
+
+/* Pre-rendered project pages */
+.project-columns {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+    gap: 1.5rem;
+    align-items: start;
+}
+
+.project-figure {
+    margin: 0 0 1rem 0;
+}
+
+.project-figure img {
+    width: 100%;
+    height: auto;
+    border-radius: 8px;
+}
+
+.project-figure figcaption {
+    text-align: center;
+    font-size: 0.875rem;
+    opacity: 0.6;
+    margin-top: 0.375rem;
+}
+
+/* Time counter animation */
+.counter {
+    font-size: 2.5rem;
+    font-weight: 700;
+    color: #3867d6;
+}
+"""
+
+# Bundled in this order, so later sources still win where rules overlap
+STYLE_SOURCES = (GLOBAL_CSS, PROFILE_CSS, SKILLS_CSS, FOOTER_CSS)
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_AROUND = re.compile(r"\s*([{};:,>])\s*")
+_BUNDLE_NAME = re.compile(r"site\.[0-9a-f]{12}\.css")
+
+
+def minify_css(css):
+    """Drop comments and every bit of whitespace the browser doesn't need"""
+    css = re.sub(r"\s+", " ", _COMMENT.sub("", css))
+    return _SPACE_AROUND.sub(r"\1", css).replace(";}", "}").strip()
+
+
+def _rules(css):
+    """Split minified CSS into its top-level rules (an @keyframes or @media block is one rule)"""
+    rules, depth, start = [], 0, 0
+    for position, char in enumerate(css):
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:position + 1])
+                start = position + 1
+    return rules
+
+
+@lru_cache(maxsize=None)
+def css_bundle():
+    """Return (css, filename) of the bundle; the filename carries the first 12 hex digits of its SHA-256"""
+    rules = _rules(minify_css("\n".join(STYLE_SOURCES)))
+    # Of identical rules only the last one matters to the cascade
+    unique = list(reversed(dict.fromkeys(reversed(rules))))
+    css = "".join(unique)
+    return css, f"site.{hashlib.sha256(css.encode('utf-8')).hexdigest()[:12]}.css"
+
+
+def write_css_bundle(directory=CSS_DIR):
+    """Write the bundle into directory unless it is already there, removing older bundles; returns its path"""
+    css, filename = css_bundle()
+    path = os.path.join(directory, filename)
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(css)
+        os.replace(temporary, path)
+        for name in os.listdir(directory):
+            if _BUNDLE_NAME.fullmatch(name) and name != filename:
+                os.remove(os.path.join(directory, name))
+    return path
+
+
+@lru_cache(maxsize=None)
+def stylesheet_tag():
+    """The tag each run emits: a <link> to the bundle, or the bundle inline if it can't be written"""
+    try:
+        path = write_css_bundle()
+    except OSError:
+        # e.g. a read-only deployment
+        return f"<style>{css_bundle()[0]}</style>"
+    return f'<link rel="stylesheet" href="{asset_url(path, CSS_URL + os.path.basename(path))}">'
@@ -0,0 +1,130 @@
+"""
+Gzip and Brotli copies of the site's text files, compressed once instead of on every response
+Run `python compressed_assets.py` to write <file>.gz and <file>.br next to every stylesheet, SVG and
+page in static/ (export_site.py does the same for site/, and the warm-up for static/ at startup).
+static_assets.py sends the smallest copy the browser accepts. Brotli is skipped if the brotli package
+isn't installed.
+"""
+import gzip
+import os
+from functools import lru_cache
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+STATIC_DIR = os.path.join(APP_DIR, "static")
+
+# Files worth compressing; images and PDFs are compressed already
+TEXT_TYPES = (".css", ".svg", ".html", ".js", ".txt", ".xml")
+
+# Below this many bytes the headers cost more than compression saves
+MIN_SIZE = 256
+
+
+def _brotli():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+@lru_cache(maxsize=None)
+def _encoders():
+    """{Content-Encoding: (file suffix, compress function)}, most effective first"""
+    encoders = {}
+    brotli = _brotli()
+    if brotli is not None:
+        encoders["br"] = (".br", lambda data: brotli.compress(data, quality=11))
+    # mtime=0 keeps the output identical between builds
+    encoders["gzip"] = (".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))
+    return encoders
+
+
+def compress_file(path):
+    """Write the compressed copies of one file that are missing or older than it; returns how many were written"""
+    written = 0
+    stat = os.stat(path)
+    data = None
+    for suffix, compress in _encoders().values():
+        target = path + suffix
+        if os.path.exists(target) and os.stat(target).st_mtime_ns >= stat.st_mtime_ns:
+            continue
+        if data is None:
+            with open(path, "rb") as file:
+                data = file.read()
+        compressed = compress(data)
+        if len(compressed) >= len(data):
+            # Nothing gained: don't leave an older copy behind either
+            if os.path.exists(target):
+                os.remove(target)
+            continue
+        temporary = f"{target}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(compressed)
+        os.replace(temporary, target)
+        written += 1
+    return written
+
+
+def compress_directory(directory=STATIC_DIR):
+    """Compress every text file under directory and drop copies whose original is gone; returns files written"""
+    written = 0
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if filename.endswith((".gz", ".br")):
+                if path[:-3].lower().endswith(TEXT_TYPES) and not os.path.exists(path[:-3]):
+                    os.remove(path)
+            elif filename.lower().endswith(TEXT_TYPES) and os.path.getsize(path) >= MIN_SIZE:
+                written += compress_file(path)
+    return written
+
+
+def _accepted(accept_encoding):
+    """The encodings an Accept-Encoding header allows (q=0 excluded)"""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.partition(";")
+        params = params.strip()
+        quality = params[2:] if params.startswith("q=") else "1"
+        try:
+            if float(quality) > 0:
+                accepted.add(coding.strip().lower())
+        except ValueError:
+            continue
+    return accepted
+
+
+def compressed_copies(path):
+    """{Content-Encoding: path of its copy} for the up-to-date compressed copies of a file, most effective first"""
+    copies = {}
+    for encoding, (suffix, _) in _encoders().items():
+        target = path + suffix
+        try:
+            # A copy older than its file is stale until the next build
+            if os.stat(target).st_mtime_ns >= os.stat(path).st_mtime_ns:
+                copies[encoding] = target
+        except OSError:
+            continue
+    return copies
+
+
+def compressed_variant(path, accept_encoding, copies=None):
+    """(path of the copy to send, Content-Encoding) for a request, or (path, None) to send the file itself"""
+    accepted = _accepted(accept_encoding)
+    copies = compressed_copies(path) if copies is None else copies
+    for encoding, target in copies.items():
+        if encoding in accepted or "*" in accepted:
+            return target, encoding
+    return path, None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write .gz and .br copies of the site's text files")
+    parser.add_argument("directory", nargs="?", default=STATIC_DIR, help="directory to compress (default: static/)")
+    args = parser.parse_args()
+    if _brotli() is None:
+        print("brotli isn't installed; writing gzip copies only")
+    count = compress_directory(args.directory)
+    print(f"Wrote {count} compressed files under {args.directory}")
@@ -0,0 +1,129 @@
+"""
+First-page previews of the PDFs in Ect-files/
+Run `python document_previews.py` to (re)build them. Each preview is named after the PDF's content
+hash, so a PDF is only rendered again when its bytes change, and identical PDFs share one preview.
+The tabs show the previews inline; the PDF itself is only sent when its download button is clicked.
+"""
+import json
+import os
+import threading
+
+from static_assets import asset_url, clear_asset_urls, file_digest
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(APP_DIR, "Ect-files")
+OUTPUT_DIR = os.path.join(APP_DIR, "static", "previews")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+# Where Streamlit's static file serving (server.enableStaticServing) exposes OUTPUT_DIR
+STATIC_URL = "/app/static/previews/"
+
+# Previews are shown PREVIEW_DISPLAY_WIDTH pixels wide and rendered at twice that for 2x screens
+PREVIEW_DISPLAY_WIDTH = 280
+PREVIEW_WIDTH = 2 * PREVIEW_DISPLAY_WIDTH
+PREVIEW_QUALITY = 75
+
+_manifest_lock = threading.Lock()
+_manifest = None
+
+
+def _render_first_page(source_path, output_path):
+    """Render page one of a PDF to a WebP PREVIEW_WIDTH pixels wide; returns (width, height, pages)"""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source_path)
+    try:
+        page = pdf[0]
+        image = page.render(scale=PREVIEW_WIDTH / page.get_width()).to_pil().convert("RGB")
+        image.save(output_path, format="WEBP", quality=PREVIEW_QUALITY, method=6)
+        return image.width, image.height, len(pdf)
+    finally:
+        pdf.close()
+
+
+def build_previews(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR):
+    """Render a preview of every PDF in source_dir that doesn't have one yet, and write the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            previous = json.load(file)
+    rendered = {entry["file"]: entry for entry in previous.values()}
+
+    previews = {}
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.lower().endswith(".pdf"):
+            continue
+        source_path = os.path.join(source_dir, filename)
+        digest = file_digest(source_path)
+        preview_file = f"{digest[:16]}.webp"
+        entry = rendered.get(preview_file)
+        if not entry or not os.path.exists(os.path.join(output_dir, preview_file)):
+            width, height, pages = _render_first_page(source_path, os.path.join(output_dir, preview_file))
+            entry = {"file": preview_file, "width": width, "height": height, "pages": pages}
+            print(f"{filename}: {pages} pages, preview {os.path.getsize(os.path.join(output_dir, preview_file)) // 1024} KB")
+        previews[filename] = dict(entry, sha256=digest, pdf_bytes=os.path.getsize(source_path),
+                                  bytes=os.path.getsize(os.path.join(output_dir, preview_file)))
+        rendered[preview_file] = previews[filename]
+
+    # Drop the previews of PDFs that changed or were removed
+    current = {entry["file"] for entry in previews.values()}
+    for filename in os.listdir(output_dir):
+        if filename.endswith(".webp") and filename not in current:
+            os.remove(os.path.join(output_dir, filename))
+
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(previews, file, indent=2, sort_keys=True)
+    invalidate_manifest()
+    return previews
+
+
+def _load_manifest():
+    """Return the manifest, reading it from disk only on first use (or after invalidate_manifest)."""
+    global _manifest
+    manifest = _manifest
+    if manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            manifest = {}
+        with _manifest_lock:
+            _manifest = manifest
+    return manifest
+
+
+def invalidate_manifest():
+    """Forget the loaded manifest, e.g. after rebuilding the previews while the app is running."""
+    global _manifest
+    with _manifest_lock:
+        _manifest = None
+    clear_asset_urls()
+
+
+def _is_current(path, entry):
+    """True if a manifest entry was built from the document's current contents"""
+    try:
+        return file_digest(path) == entry["sha256"]
+    except OSError:
+        return False
+
+
+def preview_entry(path):
+    """Return the manifest entry of a document's preview, or None if it hasn't been built for its current contents."""
+    entry = _load_manifest().get(os.path.basename(path))
+    # An edited document shows no preview (or page count) of its old contents
+    return entry if entry and _is_current(path, entry) else None
+
+
+def preview_url(entry):
+    """Return the static URL of the preview a preview_entry describes, or None."""
+    return asset_url(os.path.join(OUTPUT_DIR, entry["file"]), f"{STATIC_URL}{entry['file']}") if entry else None
+
+
+if __name__ == "__main__":
+    built = build_previews()
+    total_pdf = sum(entry["pdf_bytes"] for entry in built.values())
+    total_preview = sum(entry["bytes"] for entry in built.values())
+    print(f"Wrote {MANIFEST_PATH} ({len(built)} documents, {total_pdf // 1024} KB of PDF previewed in {total_preview // 1024} KB)")
@@ -0,0 +1,284 @@
+"""
+Static export of the whole portfolio
+Run `python export_site.py` to render every tab and project page to plain HTML in site/, with the
+photos and documents copied next to them. Any static file server can host the result.
+"""
+import datetime
+import html
+import os
+import shutil
+import textwrap
+from urllib.parse import quote
+
+from components.footer import footer_html
+from components.header import INTRO_HTML, NAME, PROFILE_IMAGE, SOCIAL_LINKS, profile_picture_html, social_link_html
+from components.project_page import inline_html, project_page_html
+from components.skills import SKILLS, skill_category_html
+from components.styles import css_bundle, write_css_bundle
+from compressed_assets import compress_directory
+from document_previews import OUTPUT_DIR as PREVIEWS_DIR, PREVIEW_DISPLAY_WIDTH, build_previews, preview_entry
+from github_images import CACHE_DIR as REMOTE_DIR, CACHE_URL as REMOTE_URL
+from image_variants import OUTPUT_DIR as VARIANTS_DIR, STATIC_URL, build_variants
+from optimized_documents import build_optimized, optimized_path
+from project_registry import CATEGORIES, FEATURED_PROJECT, PROJECTS, PROJECTS_BY_NAME, STATUS_INDICATORS, projects_in_category
+from site_content import (
+    ABOUT,
+    CERT_PORTFOLIO_INTRO,
+    CERT_PORTFOLIO_TITLE,
+    CERTIFICATIONS,
+    CERTIFICATIONS_INTRO,
+    CURRENTLY_LEARNING,
+    PORTFOLIO_ITEMS,
+)
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SITE_DIR = os.path.join(APP_DIR, "site")
+
+# The tabs of the app, one page each: (label, file)
+TABS = [
+    ("Home", "index.html"),
+    ("Projects", "projects.html"),
+    ("Skills", "skills.html"),
+    ("Google Cybersecurity Cert", "certifications.html"),
+]
+ACTIVE = ' class="active"'
+
+# Layout the Streamlit page gets from Streamlit itself: columns, tabs, buttons
+SITE_CSS = """
+body {
+    margin: 0;
+    font-family: "Source Sans Pro", -apple-system, BlinkMacSystemFont, "Segoe UI", sans-serif;
+    color: #31333f;
+    background: #ffffff;
+    line-height: 1.6;
+}
+main {
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 3rem 1.5rem;
+}
+a { color: #0068c9; }
+hr { border: none; border-top: 1px solid rgba(49, 51, 63, 0.2); margin: 2rem 0; }
+img { max-width: 100%; }
+img.preview { height: auto; border: 1px solid rgba(49, 51, 63, 0.2); }
+.site-header { display: grid; grid-template-columns: 1fr 3fr; gap: 1rem; align-items: start; }
+.site-header h1 { margin-top: 0; }
+.columns { display: grid; gap: 1rem; align-items: start; }
+.columns-2 { grid-template-columns: repeat(2, 1fr); }
+.columns-3 { grid-template-columns: repeat(3, 1fr); }
+.columns-4 { grid-template-columns: repeat(4, 1fr); }
+@media (max-width: 640px) {
+    .site-header, .columns { grid-template-columns: 1fr; }
+}
+.tabs { display: flex; flex-wrap: wrap; gap: 1.5rem; border-bottom: 1px solid rgba(49, 51, 63, 0.2); margin: 1rem 0 2rem; }
+.tabs a { padding: 0.5rem 0; color: inherit; text-decoration: none; border-bottom: 2px solid transparent; }
+.tabs a.active { color: #ff4b4b; border-bottom-color: #ff4b4b; }
+.button {
+    display: inline-block;
+    padding: 0.25rem 0.75rem;
+    margin: 0.25rem 0;
+    border: 1px solid rgba(49, 51, 63, 0.2);
+    border-radius: 0.5rem;
+    color: inherit;
+    text-decoration: none;
+}
+.button:hover { border-color: #ff4b4b; color: #ff4b4b; }
+.error { padding: 1rem; border-radius: 0.5rem; background: rgba(255, 43, 43, 0.09); color: #7d353b; }
+"""
+
+
+def _paragraphs(text):
+    return "".join(f"<p>{inline_html(paragraph)}</p>" for paragraph in text.split("\n\n"))
+
+
+def _list(items):
+    return f"<ul>{''.join(f'<li>{inline_html(item)}</li>' for item in items)}</ul>"
+
+
+def _columns(cells, count):
+    return f'<div class="columns columns-{count}">{"".join(f"<div>{cell}</div>" for cell in cells)}</div>'
+
+
+def _document_link(label, path, download_name, missing_message):
+    """Link to a copied document, or the app's error message if it is missing"""
+    if not os.path.exists(os.path.join(APP_DIR, path)):
+        return f'<p class="error">{html.escape(missing_message)}</p>'
+    name = os.path.basename(download_name)
+    link = f'<a class="button" href="files/{quote(name)}" download="{html.escape(name)}">{label}</a>'
+    preview = preview_entry(path)
+    if not preview:
+        return link
+    height = round(preview["height"] * PREVIEW_DISPLAY_WIDTH / preview["width"])
+    image = (f'<img class="preview" src="previews/{preview["file"]}" width="{PREVIEW_DISPLAY_WIDTH}" height="{height}" '
+             f'alt="First page of {html.escape(name)}" loading="lazy">')
+    return f'<p>{image}</p>{link}'
+
+
+def _header(root):
+    links = "".join(social_link_html(link, sprite_url=f"{root}icons.svg") for link in SOCIAL_LINKS)
+    picture = profile_picture_html()
+    if picture:
+        picture = picture.replace(STATIC_URL, f"{root}derived/")
+    else:
+        picture = f'<img src="{root}files/{os.path.basename(PROFILE_IMAGE)}" class="profile-img" width="150" height="150" alt="{NAME}">'
+    return (
+        f'<header class="site-header"><div>{picture}</div>'
+        f'<div><h1>{NAME}</h1>{INTRO_HTML}<div class="columns columns-3">{links}</div></div></header>'
+    )
+
+
+def _tabs(active, root):
+    links = "".join(
+        f'<a href="{root}{file}"{ACTIVE if label == active else ""}>{html.escape(label)}</a>'
+        for label, file in TABS
+    )
+    return f'<nav class="tabs">{links}</nav>'
+
+
+def _page(title, active, body, root=""):
+    """A complete page: header, tab bar, body and footer"""
+    footer = textwrap.dedent(footer_html(datetime.date.today().year, sprite_url=f"{root}icons.svg"))
+    return (
+        "<!DOCTYPE html>\n"
+        '<html lang="en"><head><meta charset="utf-8">'
+        '<meta name="viewport" content="width=device-width, initial-scale=1">'
+        f"<title>{html.escape(title)} · {NAME}</title>"
+        '<link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🚀</text></svg>">'
+        f'<link rel="stylesheet" href="{root}site.css"><link rel="stylesheet" href="{root}{css_bundle()[1]}"></head>'
+        f"<body><main>{_header(root)}{_tabs(active, root)}{body}<hr>{footer}</main></body></html>\n"
+    )
+
+
+def home_page():
+    certificates = [
+        f"<p><strong>{inline_html(cert['title'])}</strong></p>{_list(cert['notes'])}"
+        + _document_link("View Certificate", cert["file"], cert["download_name"], cert["missing"])
+        for cert in CERTIFICATIONS
+    ]
+    body = (
+        f"<h3>About</h3>{_paragraphs(ABOUT)}<hr>"
+        f"<h3>Certifications &amp; Learning Journey</h3>{_paragraphs(CERTIFICATIONS_INTRO)}{_columns(certificates, 2)}<hr>"
+        f"<h3>Currently Learning</h3><p><strong>{inline_html(CURRENTLY_LEARNING['title'])}</strong></p>"
+        f"{_list(CURRENTLY_LEARNING['notes'])}"
+    )
+    return _page("Home", "Home", body)
+
+
+def projects_page():
+    legend = [f"{indicator['emoji']} <strong>{indicator['label']}</strong>" for indicator in STATUS_INDICATORS.values()]
+    featured_slug = PROJECTS_BY_NAME[FEATURED_PROJECT["name"]]["slug"]
+    parts = [
+        "<h1>Projects</h1><h4>Project Status Legend:</h4>",
+        _columns(legend, len(legend)),
+        "<hr>",
+        f'<div class="featured-project"><span class="featured-badge">✨ FEATURED PROJECT</span>'
+        f"<h3>{inline_html(FEATURED_PROJECT['name'])}</h3><p>{inline_html(FEATURED_PROJECT['tagline'])}</p></div>",
+        _columns([_paragraphs(FEATURED_PROJECT["why"]), f'<a class="button" href="projects/{featured_slug}.html">View Details</a>'], 2),
+        "<hr>",
+    ]
+    for index, category in enumerate(CATEGORIES):
+        cards = [
+            f'<a class="button" href="projects/{project["slug"]}.html">'
+            f'{STATUS_INDICATORS[project["status"]]["emoji"]} {inline_html(project["name"])}</a>'
+            f"<p>{inline_html(project['summary'])}</p>"
+            for project in projects_in_category(category["name"])
+        ]
+        parts.append(f"<h3>{inline_html(category['name'])}</h3>{_columns(cards, category['columns'])}")
+        if index < len(CATEGORIES) - 1:
+            parts.append("<hr>")
+    return _page("Projects", "Projects", "".join(parts))
+
+
+def project_page(project):
+    page = project_page_html(project)
+    if page is None:
+        raise RuntimeError(f"{project['name']}: some photos have no resized copies; run `python image_variants.py`")
+    # The photos are copied to derived/ and remote/ next to the pages instead of being served by Streamlit
+    page = page.replace(STATIC_URL, "../derived/").replace(REMOTE_URL, "../remote/")
+    body = f'<a class="button" href="../projects.html">← Back to Projects</a><hr>{page}'
+    return _page(project["name"], "Projects", body, root="../")
+
+
+def skills_page():
+    categories = [skill_category_html(category) for category in SKILLS]
+    # Same distribution as the app: even categories on the left, odd ones on the right
+    body = f"<h2>My Skills</h2>{_columns([''.join(categories[0::2]), ''.join(categories[1::2])], 2)}"
+    return _page("Skills", "Skills", body)
+
+
+def certifications_page():
+    pieces = [
+        f"<p><strong>{inline_html(item['title'])}</strong></p><p>{inline_html(item['desc'])}</p>"
+        + _document_link(item["label"], item["file"], item["download_name"], f"File not found: {item['file']}")
+        + "<hr>"
+        for item in PORTFOLIO_ITEMS
+    ]
+    body = (
+        f"<h1>{inline_html(CERT_PORTFOLIO_TITLE)}</h1>{_paragraphs(CERT_PORTFOLIO_INTRO)}<hr>"
+        f"<h3>Portfolio Pieces</h3>{_columns([''.join(pieces[0::2]), ''.join(pieces[1::2])], 2)}"
+    )
+    return _page("Google Cybersecurity Cert", "Google Cybersecurity Cert", body)
+
+
+def _write(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+def _copy_assets(site_dir):
+    """Copy the resized photos, the document previews, the icon sprite, the profile picture and every linked document into the site"""
+    shutil.copytree(VARIANTS_DIR, os.path.join(site_dir, "derived"), dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("manifest.json"))
+    # Photos downloaded from GitHub because they aren't on disk
+    if os.path.isdir(REMOTE_DIR):
+        shutil.copytree(REMOTE_DIR, os.path.join(site_dir, "remote"), dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns("*.json", "*.tmp"))
+    shutil.copytree(PREVIEWS_DIR, os.path.join(site_dir, "previews"), dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns("manifest.json"))
+    shutil.copy2(os.path.join(APP_DIR, "static", "icons.svg"), os.path.join(site_dir, "icons.svg"))
+    files_dir = os.path.join(site_dir, "files")
+    os.makedirs(files_dir, exist_ok=True)
+    documents = [(PROFILE_IMAGE, PROFILE_IMAGE)]
+    documents += [(cert["file"], cert["download_name"]) for cert in CERTIFICATIONS]
+    documents += [(item["file"], item["download_name"]) for item in PORTFOLIO_ITEMS]
+    for path, download_name in documents:
+        source = os.path.join(APP_DIR, path)
+        if os.path.exists(source):
+            # The recompressed copy when there is one (the profile picture never has one)
+            shutil.copy2(optimized_path(source), os.path.join(files_dir, os.path.basename(download_name)))
+
+
+def export_site(site_dir=SITE_DIR):
+    """Render every page into site_dir and copy the assets they use; returns the pages written."""
+    # Pages point at the resized photos, the document previews and the optimized documents, so make sure they are up to date
+    build_variants()
+    build_previews()
+    build_optimized()
+    pages = {
+        "index.html": home_page(),
+        "projects.html": projects_page(),
+        "skills.html": skills_page(),
+        "certifications.html": certifications_page(),
+    }
+    for project in PROJECTS:
+        pages[f"projects/{project['slug']}.html"] = project_page(project)
+
+    for name, text in pages.items():
+        _write(os.path.join(site_dir, name), text)
+    _write(os.path.join(site_dir, "site.css"), SITE_CSS.lstrip())
+    write_css_bundle(site_dir)
+    _copy_assets(site_dir)
+    # .gz/.br copies next to each page and stylesheet, for servers that send them as is (nginx gzip_static / brotli_static)
+    compress_directory(site_dir)
+    return sorted(pages)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Render the portfolio to static HTML")
+    parser.add_argument("--output", default=SITE_DIR, help="directory to write the site to (default: site/)")
+    args = parser.parse_args()
+    written = export_site(args.output)
+    print(f"Wrote {len(written)} pages to {args.output}")
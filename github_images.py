@@ -1,13 +1,51 @@
 """
 Helper module to load images from GitHub raw content URLs
-This is a workaround for deployment environments where local files aren't accessible
+This is a workaround for deployment environments where local files aren't accessible.
+Images are downloaded once by the server, kept on disk and served from the app's static folder;
+a cached copy is revalidated with its ETag once it is older than REVALIDATE_AFTER. Downloads run in
+the warm-up or on a background thread, never in a visitor's rerun, which shows the copy on disk (or
+links to GitHub) until they finish.
 """
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote, urlsplit
+
 import streamlit as st
-from urllib.parse import quote
+
+from static_assets import asset_url, clear_asset_urls
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # Dictionary mapping filenames to GitHub raw URLs
-# Replace this URL with your actual GitHub repository URL
-GITHUB_IMAGE_BASE_URL = "https://raw.githubusercontent.com/gitgitgitgitgitgitgitgitgitgitgitgit/Personal_website/main/projects/"
+# Replace this URL with your actual GitHub repository URL (or set GITHUB_IMAGE_BASE_URL,
+# e.g. to a local `python -m http.server` when testing)
+GITHUB_IMAGE_BASE_URL = os.environ.get(
+    "GITHUB_IMAGE_BASE_URL",
+    "https://raw.githubusercontent.com/gitgitgitgitgitgitgitgitgitgitgitgit/Personal_website/main/projects/",
+)
+
+# Downloaded images, exposed by Streamlit's static file serving (server.enableStaticServing)
+CACHE_DIR = os.path.join(APP_DIR, "static", "remote")
+CACHE_URL = "/app/static/remote/"
+
+# How long a downloaded image is used before asking GitHub whether it changed (seconds)
+REVALIDATE_AFTER = 24 * 60 * 60
+
+# How long to wait before retrying an image that couldn't be downloaded (seconds)
+RETRY_FAILED_AFTER = 5 * 60
+
+REQUEST_TIMEOUT = 10
+
+_lock = threading.Lock()
+_failed = {}  # url -> time of the last failed download
+_copies = {}  # url -> metadata of its copy on disk, or None if there is none; read from disk once
+_refreshing = set()  # urls being downloaded in the background
+
 
 def get_github_image_url(filename: str) -> str:
     """Return the GitHub raw URL for an image filename."""
@@ -15,11 +53,142 @@ def get_github_image_url(filename: str) -> str:
     encoded_filename = quote(filename)
     return f"{GITHUB_IMAGE_BASE_URL}{encoded_filename}"
 
+
+@lru_cache(maxsize=None)
+def _session():
+    """One pooled HTTP session for every download, retrying transient failures."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), allowed_methods=("GET",))
+    adapter = HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _cache_paths(url):
+    """Paths of the cached bytes and of their metadata; named after the URL's hash"""
+    extension = os.path.splitext(urlsplit(url).path)[1].lower()
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+    return os.path.join(CACHE_DIR, f"{name}{extension}"), os.path.join(CACHE_DIR, f"{name}.json")
+
+
+def _write_atomically(path, data):
+    temporary = f"{path}.{threading.get_ident()}.tmp"
+    with open(temporary, "wb") as file:
+        file.write(data)
+    os.replace(temporary, path)
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=None)
+def _executor():
+    """Background threads for downloads started from a rerun"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="github-images")
+
+
+def _cached_meta(url):
+    """Metadata of url's copy on disk, or None; the disk is only checked the first time"""
+    with _lock:
+        if url in _copies:
+            return _copies[url]
+    data_path, meta_path = _cache_paths(url)
+    meta = _read_meta(meta_path) if os.path.exists(data_path) else None
+    with _lock:
+        return _copies.setdefault(url, meta)
+
+
+def fetch_cached(url):
+    """
+    Return the path of a local copy of url, downloading or revalidating it as needed.
+    Returns None if it can't be downloaded and no copy is cached. This blocks on the network, so it
+    runs in the warm-up and on background threads (see refresh_in_background).
+    """
+    import requests
+
+    data_path, meta_path = _cache_paths(url)
+    meta = _cached_meta(url)
+    if meta and time.time() - meta["checked"] < REVALIDATE_AFTER:
+        return data_path
+
+    # Don't hit the network on every rerun for an image that isn't there
+    if time.time() - _failed.get(url, 0) < RETRY_FAILED_AFTER:
+        return data_path if meta else None
+
+    headers = {}
+    if meta and meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    try:
+        response = _session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException:
+        # Offline: a stale copy beats no image
+        _failed[url] = time.time()
+        return data_path if meta else None
+
+    if response.status_code == 304 and meta:
+        meta = dict(meta, checked=time.time())
+    elif response.ok:
+        meta = {"url": url, "etag": response.headers.get("ETag"), "checked": time.time()}
+        with _lock:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            _write_atomically(data_path, response.content)
+        # The copy's URL carries its old content hash
+        clear_asset_urls()
+    else:
+        _failed[url] = time.time()
+        return data_path if meta else None
+
+    _failed.pop(url, None)
+    with _lock:
+        _write_atomically(meta_path, json.dumps(meta).encode("utf-8"))
+        _copies[url] = meta
+    return data_path
+
+
+def refresh_in_background(url):
+    """Download or revalidate url on a background thread, unless that is already under way or it failed recently"""
+    with _lock:
+        if url in _refreshing or time.time() - _failed.get(url, 0) < RETRY_FAILED_AFTER:
+            return
+        _refreshing.add(url)
+
+    def refresh():
+        try:
+            fetch_cached(url)
+        finally:
+            with _lock:
+                _refreshing.discard(url)
+
+    _executor().submit(refresh)
+
+
+def github_image_src(filename):
+    """URL to show a GitHub image from: the local copy when there is one, the GitHub URL otherwise."""
+    url = get_github_image_url(filename)
+    meta = _cached_meta(url)
+    # Only reads what is already on disk; a missing or stale copy is fetched in the background
+    if meta is None or time.time() - meta["checked"] >= REVALIDATE_AFTER:
+        refresh_in_background(url)
+    if meta is None:
+        return url
+    path = _cache_paths(url)[0]
+    return asset_url(path, f"{CACHE_URL}{os.path.basename(path)}")
+
+
 def load_github_image(filename, caption=None):
     """Load an image directly from GitHub raw content"""
     try:
-        url = get_github_image_url(filename)
-        st.image(url, caption=caption)
+        st.image(github_image_src(filename), caption=caption)
         return True
     except Exception as e:
         st.error(f"Failed to load image from GitHub: {str(e)}")
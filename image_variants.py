@@ -0,0 +1,243 @@
+"""
+Responsive derivatives for the photos in projects/
+Run `python image_variants.py` to (re)build them; load_image then serves the smallest variant that fits its column
+"""
+import json
+import os
+import threading
+
+from static_assets import asset_url, clear_asset_urls
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(APP_DIR, "projects")
+OUTPUT_DIR = os.path.join(APP_DIR, "static", "derived")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+# Where Streamlit's static file serving (server.enableStaticServing) exposes OUTPUT_DIR
+STATIC_URL = "/app/static/derived/"
+
+# Widths (in pixels) generated for every photo
+WIDTHS = (480, 800, 1200, 1600)
+
+# The header's profile photo: drawn at 150 px, plus a copy for 2x screens
+PROFILE_IMAGE = "pfp.png"
+PROFILE_SOURCE = os.path.join(APP_DIR, "Ect-files", PROFILE_IMAGE)
+PROFILE_WIDTHS = (150, 300)
+
+# Width of the blurred placeholder inlined in the page while the profile photo loads
+LQIP_WIDTH = 16
+
+# Rough rendered widths of the page's columns in the wide layout
+FULL_COLUMN_WIDTH = 1200
+HALF_COLUMN_WIDTH = 800
+
+# Encoder settings per output format; AVIF is skipped if Pillow was built without it
+FORMATS = {
+    "avif": {"quality": 55},
+    "webp": {"quality": 80, "method": 6},
+    "jpg": {"quality": 82, "optimize": True, "progressive": True},
+}
+
+# st.image can only point the browser at one file, so it gets the format every browser decodes.
+# The AVIF files are there for pages that can emit a <picture> element.
+# Static URLs are handed to the browser untouched; local paths would be re-encoded to JPEG.
+SERVED_FORMATS = ("webp", "jpg")
+
+_manifest_lock = threading.Lock()
+_manifest = None
+
+
+def _pillow_formats():
+    """Return the output formats this Pillow build can write."""
+    from PIL import features
+
+    return [fmt for fmt in FORMATS if fmt != "avif" or features.check("avif")]
+
+
+def _save_variant(image, path, fmt, icc_profile=None):
+    """Encode one derivative; Pillow only writes EXIF when asked, so metadata is dropped."""
+    options = dict(FORMATS[fmt])
+    # Keep the colour profile so the colours match the original
+    if icc_profile:
+        options["icc_profile"] = icc_profile
+    image.save(path, format="JPEG" if fmt == "jpg" else fmt.upper(), **options)
+
+
+def _lqip(image):
+    """Tiny blurred JPEG of an image as a data URI, small enough to inline in the page"""
+    import base64
+    import io
+    from PIL import Image, ImageFilter
+
+    height = max(1, round(image.height * LQIP_WIDTH / image.width))
+    small = _flatten(image).resize((LQIP_WIDTH, height), Image.BILINEAR).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    small.save(buffer, format="JPEG", quality=40)
+    return "data:image/jpeg;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def _flatten(image):
+    """Return an RGB copy of an image, putting transparent pixels on white"""
+    from PIL import Image
+
+    if image.mode == "RGB":
+        return image
+    background = Image.new("RGB", image.size, "white")
+    background.paste(image, mask=image.getchannel("A") if "A" in image.getbands() else None)
+    return background
+
+
+def _build_image(source_path, stem, widths, formats, output_dir, keep_alpha=False, lqip=False):
+    """Write every width and format of one photo and return its manifest entry."""
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as original:
+        # Bake the EXIF orientation into the pixels before the metadata is stripped
+        image = ImageOps.exif_transpose(original)
+        image = image.convert("RGBA" if keep_alpha and "A" in image.getbands() else "RGB")
+        icc_profile = original.info.get("icc_profile")
+
+    # Never upscale: widths beyond the original collapse onto the original width
+    widths = sorted({min(width, image.width) for width in widths})
+    variants = []
+    for width in widths:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for fmt in formats:
+            variant_file = f"{stem}-{width}.{fmt}"
+            # JPEG has no alpha channel
+            _save_variant(_flatten(resized) if fmt == "jpg" else resized, os.path.join(output_dir, variant_file), fmt, icc_profile)
+            variants.append({
+                "width": width,
+                "format": fmt,
+                "file": variant_file,
+                "bytes": os.path.getsize(os.path.join(output_dir, variant_file)),
+            })
+    entry = {
+        "source_mtime_ns": os.stat(source_path).st_mtime_ns,
+        "width": image.width,
+        "height": image.height,
+        "variants": variants,
+    }
+    if lqip:
+        entry["lqip"] = _lqip(image)
+    return entry
+
+
+def build_variants(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, force=False):
+    """Build every derivative for the photos in source_dir and the profile photo, and write the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = os.path.join(output_dir, "manifest.json")
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as file:
+            previous = json.load(file)
+
+    # (manifest key, source path, widths, options) of every photo to process
+    sources = [
+        (filename, os.path.join(source_dir, filename), WIDTHS, {})
+        for filename in sorted(os.listdir(source_dir))
+        if filename.lower().endswith((".jpg", ".jpeg", ".png"))
+    ]
+    if os.path.exists(PROFILE_SOURCE):
+        sources.append((PROFILE_IMAGE, PROFILE_SOURCE, PROFILE_WIDTHS, {"keep_alpha": True, "lqip": True}))
+
+    formats = _pillow_formats()
+    images = {}
+    for filename, source_path, widths, options in sources:
+        source_mtime = os.stat(source_path).st_mtime_ns
+        entry = previous.get(filename)
+        if not force and entry and entry["source_mtime_ns"] == source_mtime and all(
+            os.path.exists(os.path.join(output_dir, variant["file"])) for variant in entry["variants"]
+        ):
+            images[filename] = entry
+            continue
+
+        stem = os.path.splitext(filename)[0].replace(" ", "_")
+        images[filename] = _build_image(source_path, stem, widths, formats, output_dir, **options)
+        print(f"{filename}: {len(images[filename]['variants'])} variants")
+
+    with open(manifest_path, "w", encoding="utf-8") as file:
+        json.dump(images, file, indent=2, sort_keys=True)
+    invalidate_manifest()
+    return images
+
+
+def _load_manifest():
+    """Return the manifest, reading it from disk only on first use (or after invalidate_manifest)."""
+    global _manifest
+    manifest = _manifest
+    if manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            manifest = {}
+        with _manifest_lock:
+            _manifest = manifest
+    return manifest
+
+
+def invalidate_manifest():
+    """Forget the loaded manifest, e.g. after rebuilding the variants while the app is running."""
+    global _manifest
+    with _manifest_lock:
+        _manifest = None
+    clear_asset_urls()
+
+
+def best_variant(filename, width=FULL_COLUMN_WIDTH, formats=SERVED_FORMATS):
+    """Return the manifest entry of the smallest derivative at least `width` pixels wide, or None."""
+    entry = _load_manifest().get(filename)
+    if not entry:
+        return None
+    for fmt in formats:
+        candidates = sorted(
+            (variant for variant in entry["variants"] if variant["format"] == fmt),
+            key=lambda variant: variant["width"],
+        )
+        if not candidates:
+            continue
+        # Fall back to the largest one when the column is wider than every derivative
+        best = next((variant for variant in candidates if variant["width"] >= width), candidates[-1])
+        return best
+    return None
+
+
+def variant_url(filename, width=FULL_COLUMN_WIDTH, formats=SERVED_FORMATS):
+    """Return the static URL of the best derivative for a column `width` pixels wide, or None."""
+    variant = best_variant(filename, width, formats)
+    return asset_url(os.path.join(OUTPUT_DIR, variant["file"]), f"{STATIC_URL}{variant['file']}") if variant else None
+
+
+def variant_srcsets(filename):
+    """Return {format: "url 480w, url 800w, ..."} for every built format of an image, or {}."""
+    entry = _load_manifest().get(filename)
+    if not entry:
+        return {}
+    srcsets = {}
+    for variant in sorted(entry["variants"], key=lambda variant: variant["width"]):
+        url = asset_url(os.path.join(OUTPUT_DIR, variant["file"]), f"{STATIC_URL}{variant['file']}")
+        srcsets.setdefault(variant["format"], []).append(f"{url} {variant['width']}w")
+    return {fmt: ", ".join(candidates) for fmt, candidates in srcsets.items()}
+
+
+def image_lqip(filename):
+    """Return the blurred placeholder data URI recorded for an image, or None."""
+    entry = _load_manifest().get(filename)
+    return entry.get("lqip") if entry else None
+
+
+def image_size(filename):
+    """Return the (width, height) recorded for an image at build time, or None."""
+    entry = _load_manifest().get(filename)
+    return (entry["width"], entry["height"]) if entry else None
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build resized WebP/AVIF/JPEG copies of the project photos")
+    parser.add_argument("--force", action="store_true", help="rebuild every variant, even if it is up to date")
+    args = parser.parse_args()
+    built = build_variants(force=args.force)
+    print(f"Wrote {MANIFEST_PATH} ({len(built)} images)")
@@ -0,0 +1,276 @@
+"""
+Load test of the app with many concurrent sessions, against a local server
+Starts `streamlit run Personal_website.py` (or targets --url), opens N sessions over Streamlit's
+websocket protocol and has each one replay a visitor's click path: open the Projects tab, click
+"View Details", go back, then download the resume. Reports throughput and p50/p95/p99 rerun
+latency for every concurrency level, to find where one server process saturates.
+
+    python load_test.py --sessions 1 5 10 25 50
+"""
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from urllib.parse import urlsplit
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPT_PATH = os.path.join(APP_DIR, "Personal_website.py")
+
+# The click path every simulated session replays: (step name, action, argument)
+CLICK_PATH = [
+    ("projects_tab", "tab", "Projects"),
+    ("view_details", "button", "View Details"),
+    ("back", "button", "← Back to Projects"),
+    ("cert_tab", "tab", "Google Cybersecurity Cert"),
+    ("resume", "download", "View Resume"),
+]
+
+STEP_TIMEOUT = 60  # seconds a rerun or a download may take before it counts as an error
+
+
+def start_server(port):
+    """Run the app headless on `port` and wait until it answers its health check"""
+    import requests
+
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "streamlit", "run", SCRIPT_PATH,
+            "--server.headless=true", f"--server.port={port}", "--browser.gatherUsageStats=false",
+        ],
+        cwd=APP_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {process.returncode}")
+        try:
+            if requests.get(f"http://localhost:{port}/_stcore/health", timeout=1).ok:
+                return process
+        except requests.RequestException:
+            pass
+        time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f"streamlit didn't come up on port {port}")
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class Session:
+    """One simulated browser tab: keeps its widget values and query string like the frontend does"""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.ws = None
+        self.session_id = ""
+        self.query_string = ""
+        self.tabs_id = None
+        self.buttons = {}  # label -> widget id
+        self.downloads = {}  # label -> (deferred file id, url)
+        self.values = {}  # widget id -> tab label, sent back on every rerun
+
+    async def connect(self):
+        import websockets
+
+        parts = urlsplit(self.base_url)
+        scheme = "wss" if parts.scheme == "https" else "ws"
+        self.ws = await websockets.connect(f"{scheme}://{parts.netloc}{parts.path}/_stcore/stream", subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        await self.ws.close()
+
+    async def _receive(self):
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        msg = ForwardMsg()
+        msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), STEP_TIMEOUT))
+        return msg
+
+    def _record(self, msg):
+        """Note the session id, query string and widgets a ForwardMsg carries"""
+        kind = msg.WhichOneof("type")
+        if kind == "new_session":
+            self.session_id = msg.new_session.initialize.session_id
+        elif kind == "page_info_changed":
+            self.query_string = msg.page_info_changed.query_string
+        elif kind == "delta":
+            delta = msg.delta
+            if delta.WhichOneof("type") == "add_block" and delta.add_block.WhichOneof("type") == "tab_container":
+                self.tabs_id = delta.add_block.tab_container.id
+            elif delta.WhichOneof("type") == "new_element":
+                element = delta.new_element
+                if element.WhichOneof("type") == "button":
+                    self.buttons[element.button.label] = element.button.id
+                elif element.WhichOneof("type") == "download_button":
+                    button = element.download_button
+                    self.downloads[button.label] = (button.deferred_file_id, button.url)
+                elif element.WhichOneof("type") == "link_button":
+                    # Documents are plain links when app.py serves fingerprinted assets
+                    self.downloads[element.link_button.label] = ("", element.link_button.url)
+
+    async def rerun(self, trigger=None):
+        """Send a rerun (optionally clicking the button `trigger`) and wait until the script finishes"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+        back = BackMsg()
+        back.rerun_script.query_string = self.query_string
+        back.rerun_script.page_script_hash = ""
+        for widget_id, label in self.values.items():
+            state = back.rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+            state.string_value = label
+        if trigger:
+            state = back.rerun_script.widget_states.widgets.add()
+            state.id = trigger
+            state.trigger_value = True
+        await self.ws.send(back.SerializeToString())
+
+        while True:
+            msg = await self._receive()
+            self._record(msg)
+            if msg.WhichOneof("type") == "script_finished":
+                if msg.script_finished == ForwardMsg.FINISHED_WITH_COMPILE_ERROR:
+                    raise RuntimeError("the script failed to compile")
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return
+
+    async def download(self, label):
+        """Fetch a download button's file the way the browser does; returns its size in bytes"""
+        import requests
+
+        file_id, url = self.downloads[label]
+        if file_id:
+            url = await self._deferred_url(file_id)
+        response = await asyncio.to_thread(requests.get, f"{self.base_url}{url}", timeout=STEP_TIMEOUT)
+        response.raise_for_status()
+        return len(response.content)
+
+    async def _deferred_url(self, file_id):
+        """Ask the server to run a deferred download's callable; returns the media URL it produced"""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+
+        back = BackMsg()
+        if "deferred_file_request" in BackMsg.DESCRIPTOR.fields_by_name:
+            # Streamlit 1.56
+            back.deferred_file_request.file_id = file_id
+        else:
+            back.backend_operation_request.request_id = uuid.uuid4().hex
+            back.backend_operation_request.session_id = self.session_id
+            back.backend_operation_request.deferred_file.file_id = file_id
+        await self.ws.send(back.SerializeToString())
+
+        while True:
+            msg = await self._receive()
+            self._record(msg)
+            kind = msg.WhichOneof("type")
+            if kind == "deferred_file_response" and msg.deferred_file_response.file_id == file_id:
+                response, url = msg.deferred_file_response, msg.deferred_file_response.url
+            elif kind == "backend_operation_response" and msg.backend_operation_response.request_id == back.backend_operation_request.request_id:
+                response, url = msg.backend_operation_response, msg.backend_operation_response.deferred_file.url
+            else:
+                continue
+            if response.error_msg:
+                raise RuntimeError(response.error_msg)
+            return url
+
+    async def step(self, action, argument):
+        """Do one step of the click path; returns the bytes downloaded, if any"""
+        if action == "tab":
+            self.values[self.tabs_id] = argument
+            await self.rerun()
+        elif action == "button":
+            await self.rerun(trigger=self.buttons[argument])
+        elif action == "download":
+            return await self.download(argument)
+        return 0
+
+
+async def _visitor(base_url, rounds, samples, errors):
+    """One session: load the page, then replay CLICK_PATH `rounds` times, timing every step"""
+    session = Session(base_url)
+    try:
+        await session.connect()
+        start = time.perf_counter()
+        await session.rerun()
+        samples.append(("load", (time.perf_counter() - start) * 1000, 0))
+        for _ in range(rounds):
+            for name, action, argument in CLICK_PATH:
+                start = time.perf_counter()
+                try:
+                    downloaded = await session.step(action, argument)
+                except Exception as error:
+                    if action != "download":
+                        raise
+                    # A failed download leaves the page as it was; carry on like a visitor would
+                    errors.append(f"{name}: {type(error).__name__}: {error}")
+                    continue
+                samples.append((name, (time.perf_counter() - start) * 1000, downloaded))
+    except Exception as error:
+        errors.append(f"{type(error).__name__}: {error}")
+    finally:
+        if session.ws is not None:
+            await session.close()
+
+
+async def run_level(base_url, sessions, rounds):
+    """Run `sessions` visitors at once; returns the results for that concurrency level"""
+    samples, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*(_visitor(base_url, rounds, samples, errors) for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    reruns = sorted(ms for name, ms, _ in samples if name != "resume")
+    downloads = sorted(ms for name, ms, _ in samples if name == "resume")
+    return {
+        "sessions": sessions,
+        "seconds": round(elapsed, 2),
+        "reruns": len(reruns),
+        "reruns_per_second": round(len(reruns) / elapsed, 1),
+        "p50_ms": round(_percentile(reruns, 0.50), 1),
+        "p95_ms": round(_percentile(reruns, 0.95), 1),
+        "p99_ms": round(_percentile(reruns, 0.99), 1),
+        "download_p50_ms": round(statistics.median(downloads), 1) if downloads else 0.0,
+        "downloaded_mb": round(sum(size for _, _, size in samples) / 1e6, 1),
+        "errors": errors,
+    }
+
+
+def _report(result):
+    print(
+        f"{result['sessions']:>8}{result['reruns']:>8}{result['reruns_per_second']:>10}"
+        f"{result['p50_ms']:>9}{result['p95_ms']:>9}{result['p99_ms']:>9}"
+        f"{result['download_p50_ms']:>12}{len(result['errors']):>8}"
+    )
+    for error in sorted(set(result["errors"])):
+        print(f"{'':>8}error: {error}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a visitor's click path in many concurrent sessions")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 5, 10, 25], help="concurrency levels to run (default: 1 5 10 25)")
+    parser.add_argument("--rounds", type=int, default=3, help="times each session replays the click path (default: 3)")
+    parser.add_argument("--url", help="test a server that is already running instead of starting one")
+    parser.add_argument("--port", type=int, default=8599, help="port for the server this starts (default: 8599)")
+    args = parser.parse_args()
+
+    server = None
+    if not args.url:
+        server = start_server(args.port)
+        args.url = f"http://localhost:{args.port}"
+    try:
+        print(f"{'sessions':>8}{'reruns':>8}{'reruns/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'resume ms':>12}{'errors':>8}")
+        for sessions in args.sessions:
+            _report(asyncio.run(run_level(args.url, sessions, args.rounds)))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
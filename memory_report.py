@@ -0,0 +1,152 @@
+"""
+Memory held by the app, per session and in total
+Covers session state, the image and download media each session has registered, and the
+process-wide caches (documents, rendered pages, st.cache_data / st.cache_resource).
+Served as JSON or Prometheus text by app.py (/api/memory), and logged every
+MEMORY_REPORT_INTERVAL seconds when that environment variable is set.
+"""
+import os
+import sys
+import threading
+import time
+
+from streamlit.logger import get_logger
+
+from asset_cache import document_cache_stats
+
+logger = get_logger(__name__)
+
+# Seconds between memory log lines; unset or 0 turns the log line off
+MEMORY_REPORT_INTERVAL = float(os.environ.get("MEMORY_REPORT_INTERVAL", "0") or 0)
+
+
+def _runtime():
+    from streamlit.runtime import Runtime
+
+    return Runtime.instance() if Runtime.exists() else None
+
+
+def deep_sizeof(obj, seen=None):
+    """Bytes of an object plus everything it contains (containers are followed, other objects counted shallowly)"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+
+def _stats(provider):
+    """A Streamlit stats provider's CacheStats as one flat list (the return type changed over releases)"""
+    stats = provider.get_stats()
+    if isinstance(stats, dict):
+        return [stat for family in stats.values() for stat in family]
+    return list(stats)
+
+
+def _media_by_session(runtime):
+    """{session id: (files, bytes)} of the media each session currently references"""
+    manager = runtime.media_file_mgr
+    storage = manager._storage
+    usage = {}
+    with manager._lock:
+        for session_id, file_ids in manager._files_by_session_and_coord.items():
+            files = set(file_ids.values())
+            usage[session_id] = (len(files), sum(len(storage._files_by_id[file_id].content) for file_id in files if file_id in storage._files_by_id))
+    return usage
+
+
+def _page_cache_bytes():
+    try:
+        from components.project_page import page_cache_stats
+    except ImportError:
+        return 0
+    return page_cache_stats()["bytes"]
+
+
+def memory_report():
+    """Bytes held per session and by the process-wide caches"""
+    runtime = _runtime()
+    sessions = []
+    streamlit_caches = {}
+    if runtime is not None:
+        try:
+            media = _media_by_session(runtime)
+        except AttributeError:
+            # Streamlit's media manager internals moved; report sessions without it
+            media = {}
+        for info in runtime._session_mgr.list_active_sessions():
+            session = info.session
+            files, media_bytes = media.get(session.id, (0, 0))
+            sessions.append({
+                "id": session.id,
+                "session_state_bytes": deep_sizeof(session.session_state.filtered_state),
+                "media_files": files,
+                "media_bytes": media_bytes,
+            })
+        for stat in _stats(runtime.stats_mgr):
+            # Only the cache families; newer releases also report counters here
+            category = getattr(stat, "category_name", None)
+            if category in ("st_cache_data", "st_cache_resource"):
+                streamlit_caches[category] = streamlit_caches.get(category, 0) + stat.byte_length
+
+    return {
+        "time": time.time(),
+        "sessions": sessions,
+        "totals": {
+            "sessions": len(sessions),
+            "session_state_bytes": sum(session["session_state_bytes"] for session in sessions),
+            "media_bytes": sum(session["media_bytes"] for session in sessions),
+            "document_cache_bytes": document_cache_stats()["bytes"],
+            "page_cache_bytes": _page_cache_bytes(),
+            "cache_data_bytes": streamlit_caches.get("st_cache_data", 0),
+            "cache_resource_bytes": streamlit_caches.get("st_cache_resource", 0),
+        },
+    }
+
+
+def prometheus_text(report):
+    """The report in the Prometheus text exposition format"""
+    lines = [
+        "# HELP portfolio_sessions Connected sessions.",
+        "# TYPE portfolio_sessions gauge",
+        f"portfolio_sessions {report['totals']['sessions']}",
+    ]
+    for metric, help_text in (
+        ("session_state_bytes", "Bytes held in st.session_state."),
+        ("media_bytes", "Bytes of image and download media registered by the session."),
+    ):
+        lines += [f"# HELP portfolio_{metric} {help_text}", f"# TYPE portfolio_{metric} gauge"]
+        lines += [f'portfolio_{metric}{{session="{session["id"]}"}} {session[metric]}' for session in report["sessions"]]
+    lines += ["# HELP portfolio_cache_bytes Bytes held by process-wide caches.", "# TYPE portfolio_cache_bytes gauge"]
+    for cache in ("document_cache", "page_cache", "cache_data", "cache_resource"):
+        lines.append(f'portfolio_cache_bytes{{cache="{cache}"}} {report["totals"][f"{cache}_bytes"]}')
+    return "\n".join(lines) + "\n"
+
+
+def log_memory_report():
+    """Write the totals as a single log line"""
+    totals = memory_report()["totals"]
+    logger.info("Memory: %s", " ".join(f"{key}={value}" for key, value in totals.items()))
+
+
+def start_memory_log(interval=MEMORY_REPORT_INTERVAL):
+    """Log the memory report every `interval` seconds from a daemon thread; returns it, or None if disabled"""
+    if interval <= 0:
+        return None
+
+    def loop():
+        while True:
+            time.sleep(interval)
+            try:
+                log_memory_report()
+            except Exception:
+                logger.exception("Memory report failed")
+
+    thread = threading.Thread(target=loop, name="memory-report", daemon=True)
+    thread.start()
+    return thread
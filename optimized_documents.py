@@ -0,0 +1,218 @@
+"""
+Smaller, linearized copies of the PDFs in Ect-files/, served by the download buttons
+Run `python optimized_documents.py` to (re)build them. Embedded photos are re-encoded as JPEG when
+that saves at least a tenth of their size, streams are recompressed and every copy is linearized
+("fast web view") so a browser can show page one before the rest arrives. Copies are named after the
+original's content hash: identical PDFs are stored once, and nearly identical ones are reported.
+"""
+import hashlib
+import io
+import json
+import os
+import threading
+from itertools import combinations
+
+from static_assets import clear_asset_urls, file_digest
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(APP_DIR, "Ect-files")
+OUTPUT_DIR = os.path.join(APP_DIR, "static", "documents")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+
+JPEG_QUALITY = 80
+
+# A re-encoded image replaces the original only if it is at most this fraction of its size
+MIN_IMAGE_SAVING = 0.9
+
+# Two PDFs sharing at least this fraction of their stream bytes are reported as near duplicates
+NEAR_DUPLICATE_SIMILARITY = 0.9
+
+_manifest_lock = threading.Lock()
+_manifest = None
+
+
+def _recompress_images(pdf):
+    """Re-encode the 8-bit RGB and grey images of a pdf as JPEG where that is clearly smaller; returns bytes saved"""
+    import pikepdf
+
+    saved = 0
+    for page in pdf.pages:
+        # get_images() replaced the images mapping in pikepdf 9
+        images = page.get_images() if hasattr(page, "get_images") else page.images
+        for raw in images.values():
+            image = pikepdf.PdfImage(raw)
+            # Leave alone what JPEG can't hold as is: palettes, CMYK, 1-bit masks, custom decode arrays
+            if image.bits_per_component != 8 or image.mode not in ("RGB", "L") or "/Decode" in raw or raw.get("/Filter") == pikepdf.Name.DCTDecode:
+                continue
+            before = len(raw.read_raw_bytes())
+            buffer = io.BytesIO()
+            # The soft mask (transparency) stays a separate image, so only the colour channels are encoded
+            image.as_pil_image().convert(image.mode).save(buffer, format="JPEG", quality=JPEG_QUALITY, optimize=True)
+            if buffer.tell() <= before * MIN_IMAGE_SAVING:
+                raw.write(buffer.getvalue(), filter=pikepdf.Name.DCTDecode)
+                saved += before - buffer.tell()
+    return saved
+
+
+def optimize_pdf(source_path, output_path):
+    """Write a recompressed, linearized copy of a PDF; returns the bytes saved on embedded images"""
+    import pikepdf
+
+    with pikepdf.open(source_path) as pdf:
+        saved = _recompress_images(pdf)
+        pdf.save(
+            output_path,
+            linearize=True,
+            compress_streams=True,
+            recompress_flate=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+    return saved
+
+
+def _stream_fingerprint(source_path):
+    """{hash of a stream's decoded bytes: its length} for every stream in a PDF"""
+    import pikepdf
+
+    fingerprint = {}
+    with pikepdf.open(source_path) as pdf:
+        for obj in pdf.objects:
+            if isinstance(obj, pikepdf.Stream):
+                try:
+                    data = obj.read_bytes()
+                except pikepdf.PdfError:
+                    data = obj.read_raw_bytes()
+                fingerprint[hashlib.sha256(data).hexdigest()] = len(data)
+    return fingerprint
+
+
+def _similarity(first, second):
+    """Fraction of the larger PDF's stream bytes that the two share"""
+    shared = sum(size for digest, size in first.items() if digest in second)
+    return shared / max(sum(first.values()), sum(second.values()), 1)
+
+
+def find_duplicates(source_dir=SOURCE_DIR):
+    """Return (exact, near): groups of byte-identical PDFs, and (a, b, similarity) of nearly identical pairs"""
+    paths = {
+        filename: os.path.join(source_dir, filename)
+        for filename in sorted(os.listdir(source_dir))
+        if filename.lower().endswith(".pdf")
+    }
+    by_digest = {}
+    for filename, path in paths.items():
+        by_digest.setdefault(file_digest(path), []).append(filename)
+    exact = [group for group in by_digest.values() if len(group) > 1]
+
+    # Compare one file per distinct content
+    fingerprints = {group[0]: _stream_fingerprint(paths[group[0]]) for group in by_digest.values()}
+    near = []
+    for first, second in combinations(fingerprints, 2):
+        similarity = _similarity(fingerprints[first], fingerprints[second])
+        if similarity >= NEAR_DUPLICATE_SIMILARITY:
+            near.append((first, second, round(similarity, 3)))
+    return exact, near
+
+
+def build_optimized(source_dir=SOURCE_DIR, output_dir=OUTPUT_DIR, force=False):
+    """Write an optimized copy of every PDF in source_dir that doesn't have one yet, and the manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    exact, near = find_duplicates(source_dir)
+    copies_of = {filename: group for group in exact for filename in group}
+    similar_to = {}
+    for first, second, similarity in near:
+        similar_to.setdefault(first, []).append({"file": second, "similarity": similarity})
+        similar_to.setdefault(second, []).append({"file": first, "similarity": similarity})
+
+    documents = {}
+    for filename in sorted(os.listdir(source_dir)):
+        if not filename.lower().endswith(".pdf"):
+            continue
+        source_path = os.path.join(source_dir, filename)
+        digest = file_digest(source_path)
+        output_file = f"{digest[:16]}.pdf"
+        output_path = os.path.join(output_dir, output_file)
+        if force or not os.path.exists(output_path):
+            temporary = f"{output_path}.tmp"
+            optimize_pdf(source_path, temporary)
+            os.replace(temporary, output_path)
+            print(f"{filename}: {os.path.getsize(source_path) // 1024} KB -> {os.path.getsize(output_path) // 1024} KB")
+        documents[filename] = {
+            "sha256": digest,
+            "file": output_file,
+            "bytes": os.path.getsize(source_path),
+            "optimized_bytes": os.path.getsize(output_path),
+            "duplicates": [other for other in copies_of.get(filename, []) if other != filename],
+            "near_duplicates": similar_to.get(filename, []),
+        }
+
+    # Drop the copies of PDFs that changed or were removed
+    current = {entry["file"] for entry in documents.values()}
+    for filename in os.listdir(output_dir):
+        if filename.endswith(".pdf") and filename not in current:
+            os.remove(os.path.join(output_dir, filename))
+
+    with open(os.path.join(output_dir, "manifest.json"), "w", encoding="utf-8") as file:
+        json.dump(documents, file, indent=2, sort_keys=True)
+    invalidate_manifest()
+    return documents
+
+
+def _load_manifest():
+    """Return the manifest, reading it from disk only on first use (or after invalidate_manifest)."""
+    global _manifest
+    manifest = _manifest
+    if manifest is None:
+        try:
+            with open(MANIFEST_PATH, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except FileNotFoundError:
+            manifest = {}
+        with _manifest_lock:
+            _manifest = manifest
+    return manifest
+
+
+def invalidate_manifest():
+    """Forget the loaded manifest, e.g. after rebuilding the copies while the app is running."""
+    global _manifest
+    with _manifest_lock:
+        _manifest = None
+    clear_asset_urls()
+
+
+def _is_current(path, entry):
+    """True if a manifest entry was built from the document's current contents"""
+    try:
+        return file_digest(path) == entry["sha256"]
+    except OSError:
+        return False
+
+
+def optimized_path(path):
+    """Return the path of a document's optimized copy, or the path itself if it has none or the document changed since."""
+    entry = _load_manifest().get(os.path.basename(path))
+    if entry and _is_current(path, entry):
+        candidate = os.path.join(OUTPUT_DIR, entry["file"])
+        if os.path.exists(candidate):
+            return candidate
+    return path
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write recompressed, linearized copies of the PDFs in Ect-files/")
+    parser.add_argument("--force", action="store_true", help="rebuild every copy, even if it is up to date")
+    args = parser.parse_args()
+    built = build_optimized(force=args.force)
+    for filename, entry in built.items():
+        for other in entry["duplicates"]:
+            if filename < other:
+                print(f"Identical: {filename} and {other}")
+        for near in entry["near_duplicates"]:
+            if filename < near["file"]:
+                print(f"Nearly identical ({near['similarity']:.1%} of streams shared): {filename} and {near['file']}")
+    before = sum(entry["bytes"] for entry in built.values())
+    after = sum(entry["optimized_bytes"] for entry in built.values())
+    print(f"Wrote {MANIFEST_PATH} ({len(built)} documents, {before // 1024} KB -> {after // 1024} KB)")
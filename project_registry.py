@@ -0,0 +1,451 @@
+"""
+Registry of every project shown on the Projects tab
+Each project's detail page is a list of content blocks that Personal_website.py renders generically.
+
+Block types (one dict per block, keyed by its type):
+- {"h3": "Overview"} / {"h4": "..."} / {"subheader": "..."}: headings
+- {"text": "..."}: a paragraph
+- {"markdown": "..."}: raw markdown, e.g. a link
+- {"list": [...]} / {"steps": [...]}: bulleted / numbered lists; extra lines of an item continue it
+- {"image": "file.jpg", "caption": "...", "width": "half"}: a photo from projects/
+  (width defaults to "full"; "github_fallback": True loads it from GitHub if it isn't on disk)
+- {"columns": [[blocks], [blocks]]}: side-by-side columns
+- {"divider": True}: a horizontal rule
+"""
+
+# How each project status is labelled on the listing and on project cards
+STATUS_INDICATORS = {
+    "completed": {"emoji": "✅", "label": "Completed", "color": "#28a745"},
+    "in_progress": {"emoji": "🚧", "label": "In Progress", "color": "#fd7e14"},
+    "planned": {"emoji": "🔍", "label": "Planned", "color": "#6f42c1"}
+}
+
+# Order and layout of the categories on the project listing
+CATEGORIES = [
+    {"name": "Cybersecurity Projects", "columns": 2},
+    {"name": "IoT & Hardware Projects", "columns": 2},
+    {"name": "System & Automation Projects", "columns": 3},
+    {"name": "Web & Software Development", "columns": 2},
+]
+
+# Project highlighted at the top of the listing
+FEATURED_PROJECT = {
+    "name": "Cipherless_relay",
+    "tagline": "A breakthrough encryption alternative: this seed-driven \"book cipher\" hides messages in deterministic pseudo-random text streams, making it quantum-computing resistant.",
+    "why": "**Why it matters:** Unlike traditional encryption that will be vulnerable to quantum computers, this approach maps text to positions within shared seed-based text, leaving no encryption patterns to crack.",
+    "button_key": "featured_project_button",
+}
+
+PROJECTS = [
+    # Cybersecurity Projects
+    {
+        "name": "Cyberdeck (Kali Linux on Raspberry Pi 4)",
+        "slug": "cyberdeck",
+        "status": "completed",
+        "category": "Cybersecurity Projects",
+        "summary": "A portable Kali Linux machine built for pentesting and cybersecurity tasks.",
+        "button_key": "cyber_deck",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A portable Kali Linux machine built for pentesting and cybersecurity tasks, housed in a rugged carrying case."},
+            {"h3": "Hardware Used"},
+            {"list": [
+                "Raspberry Pi 4",
+                "Official Raspberry Pi touchscreen",
+                "Bluetooth keyboard",
+                "Waterproof, shockproof carrying case",
+            ]},
+            {"h3": "Software Configuration"},
+            {"list": [
+                "Kali Linux ARM distribution",
+                "Custom scripts for hardware optimization",
+                "Pre-installed security tools",
+            ]},
+            {"subheader": "Photos"},
+            {"columns": [
+                [{"image": "kali closed.jpg", "caption": "Cyberdeck Closed", "width": "half", "github_fallback": True}],
+                [{"image": "kali open.jpg", "caption": "Cyberdeck Open", "width": "half", "github_fallback": True}],
+            ]},
+            {"image": "kali on.jpg", "caption": "Cyberdeck Powered On", "github_fallback": True},
+        ],
+    },
+    {
+        "name": "Cipherless_relay",
+        "slug": "cipherless_relay",
+        "status": "in_progress",
+        "category": "Cybersecurity Projects",
+        "summary": "A seed-driven \"book cipher\" system that maps text to positions on a shared seed.",
+        "button_key": "cyber_cipherless",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A seed-driven \"book cipher\" that hides your message in a deterministic pseudo-random text stream. Instead of sending encrypted files, you share a short hex pointer plus an encrypted phrase."},
+            {"h3": "How It Works"},
+            {"steps": [
+                "You and your correspondent agree on a secret string (the seed)",
+                "The system generates text blocks where each block (default 1024 characters) is created by hashing seed + block_index",
+                "A pseudo-random generator uses that hash to produce the block on demand",
+                "The system maps your phrase to a location by hashing phrase + seed to pick a block index and offset",
+                "It computes a numeric location = block_index * block_size + offset",
+                "Creates an opaque pointer by XORing the location with a 64-bit key derived from the seed hash",
+                "The phrase is encrypted by XORing each byte with a repeating key from SHA-256(seed)",
+                "The recipient reverses the XOR on the location, regenerates the block, and extracts the message",
+            ]},
+            {"h3": "Security Features"},
+            {"list": [
+                "No traditional encryption algorithms used - resistant to quantum computing attacks",
+                "Messages are represented as positions within shared seed-based text",
+                "Even if intercepted, the transmitted data reveals nothing without the seed",
+                "Requires only Python 3.7+ and uses only standard library modules",
+            ]},
+            {"h3": "GitHub Repository"},
+            {"markdown": "[View Code on GitHub](https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit/Cipherless_relay/tree/main)"},
+            {"image": "cipherless_relay.jpg", "caption": "Cipherless_relay Project"},
+        ],
+    },
+    {
+        "name": "Red Team Pen-testing",
+        "slug": "red_team_pentesting",
+        "status": "completed",
+        "category": "Cybersecurity Projects",
+        "summary": "A comprehensive collection of mobile pentesting devices, including NetHunter, bootable drives, and specialized hardware.",
+        "button_key": "cyber_nethunter",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A comprehensive collection of devices for mobile penetration testing, digital forensics, and cybersecurity research."},
+            # Section 1: Mobile Devices
+            {"h3": "Mobile Devices"},
+            {"columns": [
+                [
+                    {"h4": "Kali NetHunter Phone"},
+                    {"list": [
+                        "Rootless implementation",
+                        "Full Kali Linux toolset",
+                        "Wireless network testing",
+                        "Penetration testing utilities",
+                        "**Status:** Configured and operational",
+                    ]},
+                ],
+                [{"image": "nethunter.jpg", "caption": "Kali NetHunter", "width": "half"}],
+            ]},
+            {"divider": True},
+            # Section 2: Bootable USB Drives
+            {"h3": "Portable Operating Systems"},
+            {"columns": [
+                [
+                    {"h4": "Bootable USB Drives"},
+                    {"list": [
+                        "Kali Linux with persistence",
+                        "Parrot OS with persistence",
+                        "Tails OS for anonymous operations",
+                        "**Status:** Prepared and tested",
+                    ]},
+                ],
+                [{"image": "linux usbs.jpg", "caption": "Bootable Linux USB Drives", "width": "half"}],
+            ]},
+            {"divider": True},
+            # Section 3: Specialized Hardware
+            {"h3": "Specialized Hardware"},
+            {"columns": [
+                [
+                    {"h4": "Raspberry Pi Devices"},
+                    {"list": [
+                        "Raspberry Pi Pico Bad USB\n"
+                        "([GitHub Repository](https://github.com/kacperbartocha/pico-badusb))\n"
+                        "Turns a Pi Pico into a BadUSB device with DuckyScript-style syntax.\n"
+                        "Automates keystroke payloads similar to a Hak5 Rubber Ducky.",
+                        "Raspberry Pi Zero 2 W running Kali Linux",
+                        "Remote access via hotspot connection",
+                        "**Status:** Configured with SSH access",
+                    ]},
+                ],
+                [
+                    {"image": "rasberrypizerow2.jpg", "caption": "Raspberry Pi Zero 2 W", "width": "half"},
+                    {"image": "badusb.jpg", "caption": "Pi Pico BadUSB", "width": "half"},
+                ],
+            ]},
+            {"divider": True},
+            # Section 4: ESP8266 Tools Integration
+            {"h3": "ESP8266 Integration"},
+            {"columns": [
+                [
+                    {"h4": "ESP8266-Based Tools"},
+                    {"list": [
+                        "Wi-Fi Deauther & Beacon Flooder\n"
+                        "([GitHub Repository](https://github.com/SpacehuhnTech/esp8266_deauther))\n"
+                        "Affordable Wi-Fi hacking firmware that scans networks, kicks clients\n"
+                        "off with deauth attacks, and floods beacon frames to clutter scanners.\n"
+                        "Great for testing 802.11 wireless security defenses.",
+                        "Rogue AP & Evil Twin\n"
+                        "([GitHub Repository](https://github.com/Deborshibd/DevilTwin-ESP8266))\n"
+                        "Spins up a fake \"evil twin\" access point that clones a real SSID.\n"
+                        "When victims connect, their traffic can be sniffed or credentials harvested.",
+                        "Captive Portal\n"
+                        "([GitHub Repository](https://github.com/beigeworm/ESP8266-Evil-Portal))\n"
+                        "Creates a captive portal on the ESP8266 that presents a fake Google\n"
+                        "login page. Perfect for social-engineering tests or security training.",
+                        "Network Reconnaissance",
+                        "**Status:** Hardware assembled, configuring firmware",
+                    ]},
+                ],
+                [{"image": "esp8266.jpg", "caption": "ESP8266 NodeMCU", "width": "half"}],
+            ]},
+        ],
+    },
+    {
+        "name": "Wazuh SIEM Server",
+        "slug": "wazuh_siem",
+        "status": "planned",
+        "category": "Cybersecurity Projects",
+        "summary": "Setting up and configuring a SIEM server for security monitoring and incident response.",
+        "button_key": "cyber_wazuh",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "Setting up and configuring a Wazuh SIEM (Security Information and Event Management) server for security monitoring."},
+            {"h3": "Planned Features"},
+            {"list": [
+                "Log collection from multiple sources",
+                "Real-time alerts for security events",
+                "Compliance monitoring",
+                "Custom dashboards for security metrics",
+            ]},
+            {"h3": "Technologies To Be Used"},
+            {"list": ["Wazuh", "Elasticsearch", "Kibana", "Linux server"]},
+            {"image": "wazuh_siem.jpg", "caption": "Wazuh SIEM Server Dashboard"},
+        ],
+    },
+    # IoT & Hardware Projects
+    {
+        "name": "Telegram Door Alert System",
+        "slug": "telegram_door_alert",
+        "status": "completed",
+        "category": "IoT & Hardware Projects",
+        "summary": "A Python project using micro:bits and a magnet to detect door status and send alerts.",
+        "button_key": "iot_door_alert",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "This project leverages two micro:bits, a magnet, and a computer to send Telegram alerts when a door is opened or closed."},
+            {"h3": "How It Works"},
+            {"steps": [
+                "The first micro:bit detects the strength of the electromagnetic field from a magnet placed on the door",
+                "When the door is opened or closed, the change in the magnetic field is sensed",
+                "A signal is sent to the second micro:bit connected to a computer",
+                "The second micro:bit communicates with the computer via serial connection",
+                "The computer uses Telegram's API to send a message alerting you of the door's status",
+            ]},
+            {"h3": "Technologies Used"},
+            {"list": [
+                "Python",
+                "Telegram Bot API",
+                "BBC micro:bit",
+                "Serial communication",
+                "Electromagnetic field sensing",
+            ]},
+            {"h3": "Setup Instructions"},
+            {"text": "To set up the Telegram bot for this project:"},
+            {"steps": [
+                "Create a Telegram bot following the official guide: https://core.telegram.org/bots",
+                "Get your chat ID and Bot token",
+                "Update these values in the computer.py script",
+            ]},
+            {"h3": "GitHub Repository"},
+            {"markdown": "[View Code on GitHub](https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit/Micro-bit_door_alarm)"},
+            {"image": "telegram_door_alert.jpg", "caption": "Telegram Door Alert System"},
+        ],
+    },
+    {
+        "name": "ESP8266 Desk Gadget",
+        "slug": "esp8266_desk_gadget",
+        "status": "completed",
+        "category": "IoT & Hardware Projects",
+        "summary": "An ESP8266-based desktop gadget displaying time, weather, and network information.",
+        "button_key": "iot_desk_gadget",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "An ESP8266-based desktop gadget with a screen and buttons to display various information."},
+            {"h3": "Features"},
+            {"list": [
+                "Time and date display",
+                "Weather information",
+                "Network speed monitoring",
+                "Pomodoro timer for productivity",
+            ]},
+            {"h3": "Technologies Used"},
+            {"list": [
+                "ESP8266 microcontroller",
+                "OLED display",
+                "Arduino programming",
+                "Various APIs for data",
+            ]},
+            {"image": "esp8266_desk_gadget.jpg", "caption": "ESP8266 Desk Gadget"},
+        ],
+    },
+    {
+        "name": "Custom PCB Project",
+        "slug": "custom_pcb",
+        "status": "in_progress",
+        "category": "IoT & Hardware Projects",
+        "summary": "Designing and fabricating a custom Printed Circuit Board for an electronics project.",
+        "button_key": "iot_pcb",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "Designing and fabricating a custom Printed Circuit Board for one of my electronics projects."},
+            {"h3": "Project Scope"},
+            {"list": [
+                "Schematic design",
+                "PCB layout",
+                "Component selection",
+                "Manufacturing and assembly",
+            ]},
+            {"h3": "Technologies Used"},
+            {"list": [
+                "KiCad for schematic and PCB design",
+                "SMD components",
+                "Professional PCB fabrication service",
+            ]},
+            {"image": "custom_pcb.jpg", "caption": "Custom PCB Design"},
+        ],
+    },
+    {
+        "name": "Telegram Weather Alert Bot",
+        "slug": "telegram_weather_bot",
+        "status": "planned",
+        "category": "IoT & Hardware Projects",
+        "summary": "A Telegram bot that sends weather alerts based on user location and preferences.",
+        "button_key": "iot_weather_bot",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A planned Telegram bot that will send weather alerts to users based on their set location."},
+            {"h3": "Planned Features"},
+            {"list": [
+                "Location-based weather monitoring",
+                "Customizable alert thresholds",
+                "Daily forecasts",
+                "Extreme weather warnings",
+            ]},
+            {"h3": "Technologies To Be Used"},
+            {"list": [
+                "Python",
+                "Telegram Bot API",
+                "Weather data API",
+                "Database for user preferences",
+            ]},
+            {"image": "telegram_weather_bot.jpg", "caption": "Telegram Weather Alert Bot Concept"},
+        ],
+    },
+    # System & Automation Projects
+    {
+        "name": "TridentOS",
+        "slug": "tridentos",
+        "status": "in_progress",
+        "category": "System & Automation Projects",
+        "summary": "A custom Ubuntu-based operating system tailored to my specific needs.",
+        "button_key": "sys_tridentos",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A custom Ubuntu-based Linux distribution tailored to my specific needs and preferences."},
+            {"h3": "Current Progress"},
+            {"list": [
+                "Base system configured",
+                "Working on package selection",
+                "Creating custom installation scripts",
+            ]},
+            {"image": "trident_os.jpg", "caption": "TridentOS Linux Distribution"},
+        ],
+    },
+    {
+        "name": "WSL Automation Toolkit",
+        "slug": "wsl_automation",
+        "status": "in_progress",
+        "category": "System & Automation Projects",
+        "summary": "A collection of scripts and tools to automate tasks within Windows Subsystem for Linux.",
+        "button_key": "sys_wsl_auto",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A collection of scripts and tools to automate tasks within Windows Subsystem for Linux."},
+            {"h3": "Tools Included"},
+            {"list": [
+                "Environment setup scripts",
+                "Windows-Linux file synchronization",
+                "Service management helpers",
+                "Development environment automation",
+            ]},
+            {"h3": "Technologies"},
+            {"list": ["Bash scripting", "PowerShell", "Python"]},
+            {"image": "wsl_automation.jpg", "caption": "WSL Automation Toolkit"},
+        ],
+    },
+    {
+        "name": "Spotify Playback Switcher",
+        "slug": "spotify_switcher",
+        "status": "planned",
+        "category": "System & Automation Projects",
+        "summary": "A tool to easily switch Spotify playback between different devices with minimal interruption.",
+        "button_key": "sys_spotify",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "A tool to easily switch Spotify playback between different devices with minimal interruption."},
+            {"h3": "Planned Features"},
+            {"list": [
+                "One-click device switching",
+                "Maintain current song position",
+                "Device presets for common scenarios",
+                "Keyboard shortcuts",
+            ]},
+            {"h3": "Technologies To Be Used"},
+            {"list": ["Python or JavaScript", "Spotify Web API", "Simple GUI interface"]},
+            {"image": "spotify_switcher.jpg", "caption": "Spotify Playback Switcher Concept"},
+        ],
+    },
+    # Web & Software Development
+    {
+        "name": "Personal Website",
+        "slug": "personal_website",
+        "status": "completed",
+        "category": "Web & Software Development",
+        "summary": "This portfolio website, coded in Python using Streamlit to showcase my projects and skills.",
+        "button_key": "web_personal_site",
+        "content": [
+            {"h3": "Overview"},
+            {"text": "This portfolio website showcases my projects, certifications, and skills - the very site you're viewing now!"},
+            {"h3": "Technologies Used"},
+            {"list": ["Python", "Streamlit framework", "GitHub for version control"]},
+            {"h3": "Features"},
+            {"list": [
+                "Responsive design",
+                "Project portfolio with detailed pages",
+                "Certification showcase with downloadable PDFs",
+                "Multiple tabs for organized content",
+            ]},
+            {"h3": "GitHub Repository"},
+            {"markdown": "[View Code on GitHub](https://github.com/gitgitgitgitgitgitgitgitgitgitgitgit/Personal_website)"},
+            {"image": "personal_website.jpg", "caption": "Personal Website Screenshot"},
+        ],
+    },
+]
+
+# Lookups built once at import, so every session shares them
+PROJECTS_BY_NAME = {project["name"]: project for project in PROJECTS}
+PROJECTS_BY_SLUG = {project["slug"]: project for project in PROJECTS}
+
+
+def projects_in_category(category):
+    """Projects of a category, in listing order."""
+    return [project for project in PROJECTS if project["category"] == category]
+
+
+def iter_blocks(blocks):
+    """Yield every block, including the ones nested inside columns."""
+    for block in blocks:
+        yield block
+        for column in block.get("columns", []):
+            yield from iter_blocks(column)
+
+
+def referenced_images():
+    """Every image filename used by a project page, in page order."""
+    images = []
+    for project in PROJECTS:
+        for block in iter_blocks(project["content"]):
+            if "image" in block and block["image"] not in images:
+                images.append(block["image"])
+    return images
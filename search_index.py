@@ -0,0 +1,260 @@
+"""
+Keyword search over the projects, the skills and the documents in Ect-files/
+Run `python search_index.py` to (re)build the index: an inverted index from every word of the project
+pages, skill categories and the documents' text to the entries it appears in, written gzipped to
+static/search/. The app loads it once per process, so a query is a few dictionary lookups and never
+reads the content or the PDFs.
+"""
+import bisect
+import gzip
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter, defaultdict
+
+from static_assets import file_digest
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+OUTPUT_DIR = os.path.join(APP_DIR, "static", "search")
+INDEX_PATH = os.path.join(OUTPUT_DIR, "index.json.gz")
+
+# Bump when the index layout changes, so an old file is rebuilt rather than misread
+INDEX_VERSION = 1
+
+# How much a word counts depending on where it appears in an entry
+FIELD_WEIGHTS = {"title": 4, "summary": 2, "body": 1}
+
+# A query word matching only the start of an indexed word scores this fraction of an exact match
+PREFIX_FACTOR = 0.5
+
+MAX_RESULTS = 8
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_URL = re.compile(r"https?://\S+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its my of on or that the this to was were with".split()
+)
+
+_index_lock = threading.Lock()
+_index = None
+
+
+def tokenize(text):
+    """Lowercase words of a text, without URLs, stopwords and single letters"""
+    return [
+        token for token in _TOKEN.findall(_URL.sub(" ", text.lower()))
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def _block_text(blocks):
+    """The text of a project's content blocks: headings, paragraphs, list items and captions"""
+    from project_registry import iter_blocks
+
+    parts = []
+    for block in iter_blocks(blocks):
+        for kind in ("h3", "h4", "subheader", "text", "markdown", "caption"):
+            if isinstance(block.get(kind), str):
+                parts.append(block[kind])
+        for kind in ("list", "steps"):
+            parts.extend(block.get(kind, []))
+    return "\n".join(parts)
+
+
+def _pdf_text(path):
+    """The text layer of every page of a PDF"""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(path)
+    try:
+        return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+
+def _documents():
+    """Every linked document as (entry, path): the Home tab's certificates, then the portfolio pieces"""
+    from site_content import CERTIFICATIONS, PORTFOLIO_ITEMS
+
+    for cert in CERTIFICATIONS:
+        yield {"kind": "document", "title": cert["title"], "tab": "Home", "file": cert["file"],
+               "summary": " ".join(cert["notes"])}, cert["file"]
+    for item in PORTFOLIO_ITEMS:
+        yield {"kind": "document", "title": item["title"], "tab": "Google Cybersecurity Cert", "file": item["file"],
+               "summary": item["desc"]}, item["file"]
+
+
+def _entries():
+    """(entry, {field: text}) for everything that can be found: projects, skill categories and documents"""
+    from components.skills import SKILLS
+    from project_registry import PROJECTS
+
+    for project in PROJECTS:
+        entry = {"kind": "project", "title": project["name"], "tab": "Projects", "slug": project["slug"],
+                 "summary": project["summary"]}
+        yield entry, {"title": project["name"], "summary": project["summary"], "body": _block_text(project["content"])}
+    for category, skills in SKILLS.items():
+        entry = {"kind": "skills", "title": category, "tab": "Skills", "summary": ", ".join(skills)}
+        yield entry, {"title": category, "summary": entry["summary"], "body": ""}
+    for entry, path in _documents():
+        body = _pdf_text(path) if os.path.exists(path) else ""
+        yield entry, {"title": entry["title"], "summary": entry["summary"], "body": body}
+
+
+def sources_digest():
+    """Hash of everything the index is built from, to tell whether a built index is stale"""
+    from components.skills import SKILLS
+    from project_registry import PROJECTS
+
+    sha = hashlib.sha256(json.dumps([INDEX_VERSION, PROJECTS, SKILLS], sort_keys=True, default=str).encode())
+    for entry, path in _documents():
+        sha.update(json.dumps(entry, sort_keys=True).encode())
+        if os.path.exists(path):
+            sha.update(file_digest(path).encode())
+    return sha.hexdigest()
+
+
+def _build():
+    """Index every entry; returns the index"""
+    docs, weighted = [], []
+    for entry, fields in _entries():
+        counts = Counter()
+        for field, text in fields.items():
+            for token in tokenize(text):
+                counts[token] += FIELD_WEIGHTS[field]
+        docs.append(entry)
+        weighted.append(counts)
+
+    # Postings are flat [doc, score, doc, score, ...] lists with integer scores: tf-idf x 100
+    document_frequency = Counter(token for counts in weighted for token in counts)
+    postings = defaultdict(list)
+    for doc_id, counts in enumerate(weighted):
+        for token, weight in counts.items():
+            idf = math.log(1 + len(docs) / document_frequency[token])
+            postings[token] += [doc_id, round((1 + math.log(weight)) * idf * 100)]
+
+    return {"version": INDEX_VERSION, "sources": sources_digest(), "docs": docs, "terms": dict(sorted(postings.items()))}
+
+
+def build_index(path=INDEX_PATH):
+    """Index every entry and write the gzipped index to path; returns the index"""
+    index = _build()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f"{path}.tmp"
+    # mtime=0 keeps the output identical between builds
+    with open(temporary, "wb") as file:
+        file.write(gzip.compress(json.dumps(index, separators=(",", ":")).encode(), compresslevel=9, mtime=0))
+    os.replace(temporary, path)
+    invalidate_index()
+    return index
+
+
+def _use_index(index):
+    """Make index the one searched by this process"""
+    global _index
+    if index.get("version") != INDEX_VERSION:
+        index = {}
+    # Sorted once here so prefix lookups are a binary search
+    index["sorted_terms"] = sorted(index.get("terms", {}))
+    with _index_lock:
+        _index = index
+    return index
+
+
+def _load_index():
+    """Return the index, reading it from disk only on first use (or after invalidate_index); None if not built"""
+    index = _index
+    if index is None:
+        try:
+            with gzip.open(INDEX_PATH, "rt", encoding="utf-8") as file:
+                index = _use_index(json.load(file))
+        except FileNotFoundError:
+            index = _use_index({})
+    return index if index.get("docs") else None
+
+
+def invalidate_index():
+    """Forget the loaded index, e.g. after rebuilding it while the app is running."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def ensure_index():
+    """Build the index if it is missing or older than its sources, then load it; returns the index"""
+    index = _load_index()
+    if index is None or index.get("sources") != sources_digest():
+        try:
+            build_index()
+        except OSError:
+            # e.g. a read-only deployment: search the index this process built, without saving it
+            return _use_index(_build())
+        index = _load_index()
+    return index
+
+
+def index_ready():
+    """True if a built index is available to search"""
+    return _load_index() is not None
+
+
+def _matches(index, token):
+    """{doc id: score} of the entries containing token, or a word it is the start of"""
+    scores = {}
+    terms, sorted_terms = index["terms"], index["sorted_terms"]
+    exact = terms.get(token, [])
+    for position in range(0, len(exact), 2):
+        scores[exact[position]] = exact[position + 1]
+    if len(token) < 2:
+        return scores
+    start = bisect.bisect_right(sorted_terms, token)
+    for term in sorted_terms[start:]:
+        if not term.startswith(token):
+            break
+        postings = terms[term]
+        for position in range(0, len(postings), 2):
+            doc_id, score = postings[position], postings[position + 1] * PREFIX_FACTOR
+            if score > scores.get(doc_id, 0):
+                scores[doc_id] = score
+    return scores
+
+
+def search(query, limit=MAX_RESULTS):
+    """Entries containing every word of query (or words starting with it), best match first"""
+    index = _load_index()
+    tokens = list(dict.fromkeys(tokenize(query)))
+    if index is None or not tokens:
+        return []
+    combined = None
+    for token in tokens:
+        scores = _matches(index, token)
+        if combined is None:
+            combined = scores
+        else:
+            combined = {doc_id: score + scores[doc_id] for doc_id, score in combined.items() if doc_id in scores}
+        if not combined:
+            return []
+    ranked = sorted(combined.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return [index["docs"][doc_id] for doc_id, _ in ranked]
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Build the keyword search index")
+    parser.add_argument("queries", nargs="*", help="queries to try against the built index")
+    args = parser.parse_args()
+    built = build_index()
+    print(f"Wrote {INDEX_PATH} ({len(built['docs'])} entries, {len(built['terms'])} words, "
+          f"{os.path.getsize(INDEX_PATH) // 1024} KB)")
+    for query in args.queries:
+        started = time.perf_counter()
+        results = search(query)
+        elapsed = (time.perf_counter() - started) * 1e6
+        print(f"{query!r}: {len(results)} results in {elapsed:.0f} µs")
+        for result in results:
+            print(f"    {result['kind']}: {result['title']}")
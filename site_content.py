@@ -0,0 +1,84 @@
+"""
+Text and documents of the Home and certification tabs
+Personal_website.py renders them with Streamlit and export_site.py renders them as static HTML.
+"""
+
+ABOUT = (
+    "I'm an 18-year-old high school student in the St. Vrain Valley School District in Colorado, combining homeschooling "
+    "with in-person programs at the Innovation Center and the Career Elevation & Technology Center (CETC). I'm passionate "
+    "about creative problem-solving with a focus on cybersecurity, manufacturing automation, and electronics. I enjoy "
+    "exploring how systems work and building smart, efficient solutions using both hardware and software.\n\n"
+    "Outside of tech and school, I enjoy playing bass, swimming, reading, and performing in musicals."
+)
+
+CERTIFICATIONS_INTRO = "I've been fortunate to learn from some great resources. Here are some of the formal certifications I've earned so far:"
+
+# Certificates on the Home tab, shown two per row
+CERTIFICATIONS = [
+    {
+        "title": "PMI Project Management Ready",
+        "notes": ["I learned about: project life cycles, stakeholder analysis, scope planning, and risk management basics"],
+        "file": "Ect-files/PMI Project Management Ready.pdf",
+        "download_name": "PMI_Project_Management_Ready.pdf",
+        "key": "pmi_cert_home",
+        "missing": "PMI Certification file not found.",
+    },
+    {
+        "title": "Autodesk Certified User: Fusion 360®",
+        "notes": ["Helped me understand: parametric modeling concepts, CAD sketching, assembly design, and technical drawing fundamentals"],
+        "file": "Ect-files/Autodesk Certified User Fusion 360.pdf",
+        "download_name": "Autodesk_Certified_User_Fusion_360.pdf",
+        "key": "autodesk_cert_home",
+        "missing": "Autodesk Certification file not found.",
+    },
+    {
+        "title": "Google Cybersecurity Professional Certificate",
+        "notes": ["Introduced me to: security concepts, basic system administration, network security, and incident response procedures"],
+        "file": "Ect-files/GoogleCybersecurityProfessionalCertificateV2_Badge20250504-27-davnwp.pdf",
+        "download_name": "GoogleCybersecurityProfessionalCertificate.pdf",
+        "key": "google_cert_home",
+        "missing": "Google Cybersecurity Certification file not found.",
+    },
+    {
+        "title": "SACA Certified Industry 4.0 Associate - Basic Operations",
+        "notes": [
+            "Gave me insights into: basic operations in Industry 4.0 environments",
+            "Silver level: Received after completing the written knowledge exam",
+        ],
+        "file": "Ect-files/SACA_Cert_MischaNelson_20250504.pdf",
+        "download_name": "SACA_Certified_I4.0_Associate_Basic_Operations.pdf",
+        "key": "saca_basic_ops_cert_home",
+        "missing": "SACA Certification file not found.",
+    },
+]
+
+CURRENTLY_LEARNING = {
+    "title": "Cisco Certified Support Technician (CCST): Networking",
+    "notes": ["Working on understanding: OSI & TCP/IP models, network configurations, subnetting, and network security fundamentals"],
+}
+
+CERT_PORTFOLIO_TITLE = "Google Professional Cybersecurity Certification Portfolio"
+
+CERT_PORTFOLIO_INTRO = (
+    "This certification equips learners with in-demand skills needed for entry-level cybersecurity roles. "
+    "The curriculum covers topics like security models, tools (SIEM, EDR), networks, threats, vulnerabilities, "
+    "Python scripting for security tasks, SQL, and incident response frameworks like NIST. "
+    "Below are the portfolio projects completed as part of this program."
+)
+
+PORTFOLIO_ITEMS = [
+    {"title": "Professional Statement", "file": "Ect-files/1# Proffessional Statment..pdf", "desc": "My goals and interests in the cybersecurity field."},
+    {"title": "NIST Framework Application", "file": "Ect-files/2# Use the NIST cybersecurity frameworks to respond..pdf", "desc": "Applying the NIST Cybersecurity Framework to respond to a security incident."},
+    {"title": "Security Audit Report", "file": "Ect-files/3# Security audit..pdf", "desc": "Conducting a security audit and documenting findings."},
+    {"title": "SQL Query Filtering", "file": "Ect-files/4# Apply filters to SQL queries.pdf", "desc": "Using SQL to filter and analyze security log data."},
+    {"title": "Vulnerability Analysis", "file": "Ect-files/5# Analyze a vulnerable system for a small business .pdf", "desc": "Analyzing system vulnerabilities for a small business scenario."},
+    {"title": "Python Algorithm for File Updates", "file": "Ect-files/6# Update a file with a python algorithm .pdf", "desc": "Using Python to automate the process of updating security-related files."},
+    {"title": "Incident Handler's Journal", "file": "Ect-files/#7 Incident handler's journal .pdf", "desc": "Documenting the steps taken during a simulated security incident response."},
+    {"title": "Resume", "file": "Ect-files/#8 Resume.pdf", "desc": "My professional resume detailing skills and experience."}
+]
+
+# Button label, download name and widget key of each portfolio piece
+for item in PORTFOLIO_ITEMS:
+    item["label"] = "View Resume" if item["title"] == "Resume" else "View Document"
+    item["download_name"] = "Resume.pdf" if item["title"] == "Resume" else item["file"].replace("#", "").replace("..", ".").strip()
+    item["key"] = f"download_{item['title'].replace(' ', '_').lower()}_tab3"
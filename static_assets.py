@@ -0,0 +1,145 @@
+"""
+Fingerprinted URLs for the site's files, served with long-lived cache headers
+When app.py mounts ASSET_ROUTE, every image, document, stylesheet and sprite is linked as
+/app/static/assets/<path with a content hash before the extension>. The URL changes whenever the
+file does, so browsers may keep it for a year ("immutable") and revalidate with its ETag. Under a
+plain `streamlit run Personal_website.py` the route isn't there and the usual URLs are used instead.
+"""
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from urllib.parse import quote
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Inside /app/static/ so st.image hands the URLs to the browser as they are (any other relative URL
+# is taken for a file path); app.py's routes take precedence over Streamlit's static file serving,
+# which means a static/assets/ folder would be shadowed
+ASSET_ROUTE = "/app/static/assets/"
+
+# Folders whose files may be served, relative to APP_DIR
+ASSET_ROOTS = ("static", "projects", "Projects", "Ect-files")
+
+# File types served, so manifests and download metadata next to the assets stay private
+ASSET_TYPES = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".avif", ".svg", ".css", ".pdf"}
+
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+_FINGERPRINT = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{12})(?P<extension>\.[^./]+)$")
+
+_lock = threading.Lock()
+_digests = {}  # absolute path -> (mtime_ns, size, sha256 hex digest)
+_urls = {}  # path as passed to asset_url -> its fingerprinted URL, or None if it isn't served
+_generation = 0  # bumped by clear_asset_urls
+_enabled = False
+
+
+def enable_asset_route():
+    """Called by app.py once it serves ASSET_ROUTE; from then on asset_url hands out fingerprinted URLs"""
+    global _enabled
+    _enabled = True
+
+
+def file_digest(path):
+    """SHA-256 hex digest of a file, recomputed only when its mtime or size changes"""
+    stat = os.stat(path)
+    with _lock:
+        cached = _digests.get(path)
+    if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+    sha = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 16), b""):
+            sha.update(chunk)
+    with _lock:
+        _digests[path] = (stat.st_mtime_ns, stat.st_size, sha.hexdigest())
+    return sha.hexdigest()
+
+
+def _relative(path):
+    """A file's path relative to APP_DIR if it is an asset that may be served, else None"""
+    absolute = os.path.realpath(os.path.join(APP_DIR, path))
+    relative = os.path.relpath(absolute, APP_DIR).replace(os.sep, "/")
+    if relative.split("/", 1)[0] not in ASSET_ROOTS or os.path.splitext(relative)[1].lower() not in ASSET_TYPES:
+        return None
+    return relative
+
+
+def clear_asset_urls():
+    """Forget the URLs handed out so far; called whenever the files behind them are rebuilt or replaced"""
+    global _generation
+    with _lock:
+        _urls.clear()
+        _generation += 1
+
+
+def asset_generation():
+    """Counter bumped whenever asset URLs are cleared, for caches of anything built from them"""
+    return _generation
+
+
+def _fingerprinted_url(path):
+    relative = _relative(path)
+    if relative is None:
+        return None
+    try:
+        digest = file_digest(os.path.join(APP_DIR, relative))
+    except OSError:
+        return None
+    stem, extension = os.path.splitext(relative)
+    return f"{ASSET_ROUTE}{quote(stem)}.{digest[:12]}{extension}"
+
+
+def asset_url(path, fallback=None):
+    """Fingerprinted URL of a file (absolute, or relative to the app), or fallback when they aren't served"""
+    if not _enabled:
+        return fallback
+    # Worked out once per file and process, so a rerun doesn't stat every image it links to
+    try:
+        url = _urls[path]
+    except KeyError:
+        url = _fingerprinted_url(path)
+        with _lock:
+            _urls[path] = url
+    return url or fallback
+
+
+def asset_response(path, if_none_match=None, download_name=None, accept_encoding=None):
+    """Starlette response for ASSET_ROUTE + path: the file (precompressed if possible), a 304 if the browser has it, or a 404"""
+    from starlette.responses import FileResponse, Response
+
+    from compressed_assets import compressed_copies, compressed_variant
+
+    match = _FINGERPRINT.match(path)
+    relative = _relative(f"{match['stem']}{match['extension']}") if match else None
+    if relative is None or not os.path.isfile(os.path.join(APP_DIR, relative)):
+        return Response(status_code=404)
+
+    absolute = os.path.join(APP_DIR, relative)
+    digest = file_digest(absolute)
+    # The .br/.gz copy written by compressed_assets.py, so nothing is compressed per request
+    copies = compressed_copies(absolute)
+    body, encoding = compressed_variant(absolute, accept_encoding, copies)
+    # Each encoding is a representation of its own, with an ETag of its own
+    etag = f'"{digest[:32]}-{encoding}"' if encoding else f'"{digest[:32]}"'
+    # A URL whose file has changed since still gets the current file, just not cached for good
+    headers = {
+        "ETag": etag,
+        "Cache-Control": IMMUTABLE if digest.startswith(match["digest"]) else "no-cache",
+    }
+    if copies:
+        # Every response for a file with compressed copies depends on Accept-Encoding, the identity one
+        # included, or a shared cache could hand one client's representation to all. Streamlit's gzip
+        # middleware appends its own Accept-Encoding to larger identity responses; a repeated Vary
+        # entry means the same thing, and below its minimum size ours is the only one
+        headers["Vary"] = "Accept-Encoding"
+    if if_none_match and etag in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    if download_name:
+        headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(download_name)}"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    media_type = mimetypes.guess_type(absolute)[0] or "application/octet-stream"
+    return FileResponse(body, media_type=media_type, headers=headers)
@@ -0,0 +1,81 @@
+"""
+Opt-in timers for the sections of a rerun
+Off unless PROFILE_TIMINGS=1 is set in the environment or the page is opened with ?profile=1.
+Each profiled rerun logs one JSON line with the time spent in every section, and the recent
+samples are kept per section for a percentile summary (served by app.py at /api/timings).
+"""
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+PROFILE_TIMINGS = os.environ.get("PROFILE_TIMINGS", "") not in ("", "0")
+
+# Samples kept per section for the summary
+MAX_SAMPLES = 1000
+
+_lock = threading.Lock()
+_samples = defaultdict(lambda: deque(maxlen=MAX_SAMPLES))  # section -> recent durations in ms
+_run = threading.local()  # each session's script runs in its own thread
+
+
+def start_run(query_params=None):
+    """Start timing a rerun if profiling is on (env var, or ?profile=1 in query_params); returns whether it is"""
+    enabled = PROFILE_TIMINGS or (query_params is not None and query_params.get("profile") == "1")
+    _run.sections = {} if enabled else None
+    _run.started = time.perf_counter_ns()
+    return enabled
+
+
+@contextmanager
+def timed(section):
+    """Time the block as `section` of the current rerun; costs one attribute check when profiling is off"""
+    sections = getattr(_run, "sections", None)
+    if sections is None:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        sections[section] = sections.get(section, 0) + (time.perf_counter_ns() - start) / 1e6
+
+
+def finish_run(**fields):
+    """Record the rerun's timings and log them as one JSON line; extra fields are added to the line"""
+    sections = getattr(_run, "sections", None)
+    if sections is None:
+        return None
+    sections = dict(sections, rerun=(time.perf_counter_ns() - _run.started) / 1e6)
+    _run.sections = None
+    with _lock:
+        for section, duration in sections.items():
+            _samples[section].append(duration)
+    logger.info(json.dumps({"event": "rerun_timing", **fields, "ms": {name: round(ms, 3) for name, ms in sections.items()}}))
+    return sections
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def timing_summary():
+    """{section: {count, p50, p90, p99, max}} in milliseconds, over the last MAX_SAMPLES reruns of each"""
+    with _lock:
+        samples = {section: sorted(durations) for section, durations in _samples.items()}
+    return {
+        section: {
+            "count": len(ordered),
+            "p50": round(_percentile(ordered, 0.50), 3),
+            "p90": round(_percentile(ordered, 0.90), 3),
+            "p99": round(_percentile(ordered, 0.99), 3),
+            "max": round(ordered[-1], 3),
+        }
+        for section, ordered in sorted(samples.items())
+    }
@@ -0,0 +1,160 @@
+"""
+Warm-up run once when the server starts, before it reports ready
+Fills the process-wide caches the first visitor would otherwise pay for (image index, manifests,
+document URLs, stylesheet and its compressed copies, rendered project pages, search index, photos
+downloaded from GitHub) and checks that every asset the pages reference is there. app.py runs it in
+the background and serves its status at /api/ready.
+"""
+import os
+import threading
+import time
+
+from streamlit.logger import get_logger
+
+logger = get_logger(__name__)
+
+_lock = threading.Lock()
+_thread = None
+_status = {"state": "pending", "seconds": None, "steps": {}, "missing": [], "errors": {}, "warnings": {}}
+
+
+def _check_images():
+    """Scan the image folders and return the referenced photos that are on neither disk nor GitHub"""
+    from asset_index import asset_report, build_asset_index
+    from github_images import fetch_cached, get_github_image_url
+    from project_registry import PROJECTS, iter_blocks, referenced_images
+
+    build_asset_index()
+    missing = asset_report(referenced_images())["missing"]
+    fallbacks = {
+        block["image"]
+        for project in PROJECTS
+        for block in iter_blocks(project["content"])
+        if "image" in block and block.get("github_fallback")
+    }
+    # Downloads the GitHub copy of a missing photo now; a rerun only ever reads the copy on disk
+    return [
+        f"image: {filename}"
+        for filename in missing
+        if filename not in fallbacks or fetch_cached(get_github_image_url(filename)) is None
+    ]
+
+
+def _load_documents():
+    """Work out the preview and download URL of every linked document, as the Home and Cert tabs do"""
+    from asset_cache import read_document
+    from document_previews import preview_entry, preview_url
+    from optimized_documents import optimized_path
+    from site_content import CERTIFICATIONS, PORTFOLIO_ITEMS
+    from static_assets import asset_url
+
+    missing = []
+    for path in sorted({document["file"] for document in CERTIFICATIONS + PORTFOLIO_ITEMS}):
+        if not os.path.exists(path):
+            missing.append(f"document: {path}")
+            continue
+        preview_url(preview_entry(path))
+        # Without a URL of its own the document is sent by a download button, which reads the shared cache
+        if asset_url(optimized_path(path)) is None:
+            read_document(optimized_path(path))
+    return missing
+
+
+def _render_pages():
+    """Render the cached HTML of the header, the skills and every project page"""
+    from components.header import PROFILE_IMAGE, profile_picture_html
+    from components.project_page import project_page_html
+    from components.skills import SKILLS, skill_category_html
+    from project_registry import PROJECTS
+
+    missing = []
+    if profile_picture_html() is None and not os.path.exists(PROFILE_IMAGE):
+        missing.append(f"image: {PROFILE_IMAGE}")
+    for category in SKILLS:
+        skill_category_html(category)
+    for project in PROJECTS:
+        project_page_html(project)
+    return missing
+
+
+def _write_stylesheet():
+    """Write the CSS bundle and check the icon sprite the pages link to"""
+    from components.styles import stylesheet_tag
+
+    stylesheet_tag()
+    return [] if os.path.exists(os.path.join("static", "icons.svg")) else ["static: static/icons.svg"]
+
+
+def _compress_static():
+    """Write the .gz/.br copies of the text files in static/ that are missing (the stylesheet was just written)"""
+    from compressed_assets import compress_directory
+
+    compress_directory()
+    return []
+
+
+def _load_search_index():
+    """Build the search index if its sources changed since it was written, and load it"""
+    from search_index import ensure_index
+
+    ensure_index()
+    return []
+
+
+# (name, step, required): the site renders without the optional steps (uncompressed text files, no
+# search box), so one that crashes, e.g. on a read-only deployment, is only a warning
+STEPS = [
+    ("images", _check_images, True),
+    ("documents", _load_documents, True),
+    ("pages", _render_pages, True),
+    ("stylesheet", _write_stylesheet, True),
+    ("compression", _compress_static, False),
+    ("search", _load_search_index, False),
+]
+
+
+def warm_up():
+    """Run every step, recording how long each took and what is missing; returns the status"""
+    with _lock:
+        _status.update(state="running", steps={}, missing=[], errors={}, warnings={})
+    started = time.perf_counter()
+    for name, step, required in STEPS:
+        step_started = time.perf_counter()
+        try:
+            missing = step()
+        except Exception as error:
+            if required:
+                logger.exception("Warm-up step %s failed", name)
+            else:
+                logger.warning("Warm-up step %s skipped: %s: %s", name, type(error).__name__, error)
+            missing = []
+            with _lock:
+                _status["errors" if required else "warnings"][name] = f"{type(error).__name__}: {error}"
+        with _lock:
+            _status["steps"][name] = round((time.perf_counter() - step_started) * 1000, 1)
+            _status["missing"] += missing
+
+    with _lock:
+        # Missing assets only cost placeholders, but a required step that crashed leaves the server cold
+        _status.update(state="failed" if _status["errors"] else "ready", seconds=round(time.perf_counter() - started, 2))
+    status = warm_up_status()
+    logger.info("Warm-up %s in %.2f s: %s", status["state"], status["seconds"], status["steps"])
+    if status["missing"]:
+        logger.warning("Missing assets: %s", ", ".join(status["missing"]))
+    return status
+
+
+def start_warm_up():
+    """Run warm_up on a background thread, once per process; returns the thread"""
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+            _thread.start()
+        return _thread
+
+
+def warm_up_status():
+    """{state: pending | running | ready | failed, seconds, steps: {step: ms}, missing, errors, warnings}"""
+    with _lock:
+        return {key: value.copy() if isinstance(value, (dict, list)) else value for key, value in _status.items()}